@@ -30,17 +30,24 @@ class CallGraph(Printable):
         self.__build(mt)
 
     def __build(self, mt: ir.Method):
-        for stmt in mt.callable_region.walk():
-            if isinstance(stmt, func.Invoke):
-                edges = self.edges.setdefault(stmt.callee, set())
-                edges.add(mt)
-                self.__build(stmt.callee)
-
+        self.__walk(mt, {mt})
         for caller in self.edges:
             for callee in self.edges[caller]:
                 backedges = self.backedges.setdefault(callee, set())
                 backedges.add(caller)
 
+    def __walk(self, mt: ir.Method, visited: set[ir.Method]):
+        # NOTE: each method is walked once, the edges of a callee do not
+        # depend on where it is invoked from.
+        for stmt in mt.callable_region.walk():
+            if isinstance(stmt, func.Invoke):
+                callee = stmt.callee
+                edges = self.edges.setdefault(callee, set())
+                edges.add(mt)
+                if callee not in visited:
+                    visited.add(callee)
+                    self.__walk(callee, visited)
+
     def get_neighbors(self, node: ir.Method) -> Iterable[ir.Method]:
         """Get the neighbors of a node in the call graph."""
         return self.edges.get(node, ())
@@ -226,7 +226,9 @@ class PartialLambda(PartialConst):
         )
 
     def __hash__(self) -> int:
-        return hash((self.argnames, self.code, self.captured))
+        # NOTE: equal partial lambdas share the same code (by identity)
+        # and captured values, the argument names follow from the code.
+        return hash((self.code, self.captured))
 
     def is_subseteq_PartialLambda(self, other: "PartialLambda") -> bool:
         if self.code is not other.code:
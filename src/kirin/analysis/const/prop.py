@@ -1,10 +1,11 @@
 from typing import final
 from dataclasses import field, dataclass
+from collections.abc import Hashable
 
 from kirin import ir, types, interp
 from kirin.analysis.forward import ForwardExtra, ForwardFrame
 
-from .lattice import Value, Result, Unknown
+from .lattice import Value, Bottom, Result, Unknown, PartialLambda
 
 
 @dataclass
@@ -15,6 +16,41 @@ class Frame(ForwardFrame[Result]):
     """If we hit any non-pure statement."""
 
 
+@dataclass(frozen=True)
+class _Purity:
+    """Purity related traits of a statement class."""
+
+    constant_like: bool
+    pure: bool
+    terminator: bool
+    maybe_pure: bool
+
+    @classmethod
+    def of(cls, node: ir.Statement) -> "_Purity":
+        return cls(
+            constant_like=node.has_trait(ir.ConstantLike),
+            pure=node.has_trait(ir.Pure),
+            terminator=node.has_trait(ir.IsTerminator),
+            maybe_pure=node.has_trait(ir.MaybePure),
+        )
+
+
+def _intern_key(values: tuple[Result, ...]) -> Hashable:
+    # NOTE: `Value` hashes by identity and the frame holds new `Value`
+    # objects on every fixpoint iteration, compare constants by their
+    # (type, data) instead. Falls back to the lattice elements themselves
+    # when the constant data is not hashable.
+    key = tuple(
+        (type(value.data), value.data) if isinstance(value, Value) else value
+        for value in values
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return values
+    return key
+
+
 @final
 @dataclass
 class Propagate(ForwardExtra[Frame, Result]):
@@ -38,6 +74,26 @@ class Propagate(ForwardExtra[Frame, Result]):
     lattice = Result
 
     _interp: interp.Interpreter = field(init=False)
+    _partial_lambdas: dict[tuple[ir.Statement, Hashable], PartialLambda] = field(
+        init=False, default_factory=dict
+    )
+    """Interned partial lambdas, reused across fixpoint iterations."""
+    _lambda_methods: dict[tuple[ir.Statement, Hashable], Value] = field(
+        init=False, default_factory=dict
+    )
+    """Interned methods of lambdas with constant captures."""
+    _invoke_memo: dict[tuple[ir.Method, Hashable], tuple[Result, bool]] = field(
+        init=False, default_factory=dict
+    )
+    """Memoized method calls, keyed by the method and the arguments."""
+    _invoke_active: set[tuple[ir.Method, Hashable]] = field(
+        init=False, default_factory=set
+    )
+    """Method calls currently being analyzed."""
+    _invoke_cycle: bool = field(init=False, default=False)
+    """Whether the current method call depends on an unfinished recursive call."""
+    _purity: dict[type[ir.Statement], _Purity] = field(init=False, default_factory=dict)
+    """Purity traits per statement class, so they are looked up once."""
 
     def __post_init__(self) -> None:
         super().__post_init__()
@@ -51,6 +107,11 @@ class Propagate(ForwardExtra[Frame, Result]):
     def initialize(self):
         super().initialize()
         self._interp.initialize()
+        self._partial_lambdas.clear()
+        self._lambda_methods.clear()
+        self._invoke_memo.clear()
+        self._invoke_active.clear()
+        self._invoke_cycle = False
         return self
 
     def initialize_frame(
@@ -61,27 +122,99 @@ class Propagate(ForwardExtra[Frame, Result]):
     def method_self(self, method: ir.Method) -> Result:
         return Value(method)
 
+    def partial_lambda(
+        self, code: ir.Statement, captured: tuple[Result, ...]
+    ) -> PartialLambda:
+        """Get the partial lambda of `code` with the `captured` values.
+
+        The same statement is visited with the same captured values on every
+        fixpoint iteration, so the result is interned for the current run.
+        Constant captures are matched by their data.
+        """
+        key = (code, _intern_key(captured))
+        ret = self._partial_lambdas.get(key)
+        if ret is None:
+            ret = self._partial_lambdas[key] = PartialLambda(code, captured)
+        return ret
+
+    def lambda_method(self, code: ir.Statement, captured: tuple[Value, ...]) -> Value:
+        """Get the method of lambda `code` with constant `captured` values.
+
+        Like [`partial_lambda`][kirin.analysis.const.Propagate.partial_lambda],
+        the method is interned for the current run so that revisiting the
+        lambda returns the same constant.
+        """
+        key = (code, _intern_key(captured))
+        ret = self._lambda_methods.get(key)
+        if ret is None:
+            ret = self._lambda_methods[key] = Value(
+                ir.Method(
+                    dialects=self.dialects,
+                    code=code,
+                    fields=tuple(each.data for each in captured),
+                )
+            )
+        return ret
+
+    def invoke_method(
+        self, mt: ir.Method, args: tuple[Result, ...]
+    ) -> tuple[Result, bool]:
+        """Call `mt` with `args` and return the result and whether the call is pure.
+
+        The result is memoized for the current run, constant arguments are
+        matched by their data. A recursive call with the same arguments sees
+        `Bottom` instead of re-entering the method, the same as hitting the
+        recursion limit, and is not considered pure.
+        """
+        key = (mt, _intern_key(args))
+        if key in self._invoke_active:
+            self._invoke_cycle = True
+            return Bottom(), False
+
+        ret = self._invoke_memo.get(key)
+        if ret is not None:
+            return ret
+
+        outer_cycle, self._invoke_cycle = self._invoke_cycle, False
+        self._invoke_active.add(key)
+        try:
+            call_frame, result = self.call(mt.code, self.method_self(mt), *args)
+        finally:
+            self._invoke_active.discard(key)
+        ret = (result, not call_frame.frame_is_not_pure)
+        # NOTE: a result computed from the `Bottom` placeholder of a recursive
+        # call is only an approximation, only memoize results that do not
+        # depend on an unfinished call.
+        if not self._invoke_cycle:
+            self._invoke_memo[key] = ret
+        self._invoke_cycle = self._invoke_cycle or outer_cycle
+        return ret
+
     def frame_eval(
         self, frame: Frame, node: ir.Statement
     ) -> interp.StatementResult[Result]:
+        purity = self._purity.get(node.__class__)
+        if purity is None:
+            purity = self._purity[node.__class__] = _Purity.of(node)
+
         method = self.lookup_registry(frame, node)
         if method is None:
-            if node.has_trait(ir.ConstantLike):
+            if purity.constant_like:
                 return self.try_eval_const_pure(frame, node, ())
-            elif node.has_trait(ir.Pure):
+            elif purity.pure:
                 values = frame.get_values(node.args)
                 if types.is_tuple_of(values, Value):
                     return self.try_eval_const_pure(frame, node, values)
 
-            if not node.has_trait(ir.Pure):
+            if not purity.pure:
                 # not pure, and no implementation, let's say it's not pure
                 frame.frame_is_not_pure = True
             return tuple(Unknown() for _ in node._results)
 
         ret = method(self, frame, node)
-        if node.has_trait(ir.IsTerminator) or node.has_trait(ir.Pure):
+        if purity.terminator or purity.pure:
             return ret
-        elif not node.has_trait(ir.MaybePure):  # cannot be pure at all
+        elif not purity.maybe_pure:  # cannot be pure at all
             frame.frame_is_not_pure = True
         elif (
             node not in frame.should_be_pure
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, final
+from dataclasses import field, dataclass
 
 from kirin import ir, types, interp
 from kirin.decl import fields
@@ -13,6 +14,7 @@ if TYPE_CHECKING:
 
 
 @final
+@dataclass
 class TypeInference(Forward[types.TypeAttribute]):
     """Type inference analysis for kirin.
 
@@ -28,6 +30,24 @@ class TypeInference(Forward[types.TypeAttribute]):
     keys = ("typeinfer",)
     lattice = types.TypeAttribute
 
+    _invoke_memo: dict[
+        tuple[ir.Method, tuple[types.TypeAttribute, ...]], types.TypeAttribute
+    ] = field(init=False, default_factory=dict)
+    """Memoized method calls, keyed by the method and the argument types."""
+    _invoke_active: set[tuple[ir.Method, tuple[types.TypeAttribute, ...]]] = field(
+        init=False, default_factory=set
+    )
+    """Method calls currently being inferred."""
+    _invoke_cycle: bool = field(init=False, default=False)
+    """Whether the current method call depends on an unfinished recursive call."""
+
+    def initialize(self):
+        super().initialize()
+        self._invoke_memo.clear()
+        self._invoke_active.clear()
+        self._invoke_cycle = False
+        return self
+
     def run(self, method: ir.Method, *args, **kwargs):
         if not args and not kwargs:  # no args or kwargs
             # use the method signature to get the args
@@ -37,6 +57,39 @@ class TypeInference(Forward[types.TypeAttribute]):
     def method_self(self, method: ir.Method) -> types.TypeAttribute:
         return method.self_type
 
+    def invoke_method(
+        self, mt: ir.Method, args: tuple[types.TypeAttribute, ...]
+    ) -> types.TypeAttribute:
+        """Call `mt` with argument types `args` and return the inferred return type.
+
+        The result is memoized for the current run. A recursive call with the
+        same argument types sees `Bottom` instead of re-entering the method,
+        the same as hitting the recursion limit, and results that depend on
+        it are not memoized.
+        """
+        key = (mt, args)
+        if key in self._invoke_active:
+            self._invoke_cycle = True
+            return types.Bottom
+
+        ret = self._invoke_memo.get(key)
+        if ret is not None:
+            return ret
+
+        outer_cycle, self._invoke_cycle = self._invoke_cycle, False
+        self._invoke_active.add(key)
+        try:
+            _, ret = self.call(mt.code, self.method_self(mt), *args)
+        finally:
+            self._invoke_active.discard(key)
+        # NOTE: a result computed from the `Bottom` placeholder of a recursive
+        # call is only an approximation, only memoize results that do not
+        # depend on an unfinished call.
+        if not self._invoke_cycle:
+            self._invoke_memo[key] = ret
+        self._invoke_cycle = self._invoke_cycle or outer_cycle
+        return ret
+
     def frame_call(
         self,
         frame: ForwardFrame[types.TypeAttribute],
@@ -44,17 +97,20 @@ class TypeInference(Forward[types.TypeAttribute]):
         *args: types.TypeAttribute,
         **kwargs: types.TypeAttribute,
     ) -> types.TypeAttribute:
+        if self.state.depth >= self.max_depth:
+            return self.recursion_limit_reached()
+
         trait = node.get_present_trait(ir.CallableStmtInterface)
         args = trait.align_input_args(node, *args, **kwargs)
         region = trait.get_callable_region(node)
-        if self.state.depth >= self.max_depth:
-            return self.recursion_limit_reached()
 
         if trait := node.get_trait(ir.HasSignature):
             signature: Signature[types.TypeAttribute] | None = trait.get_signature(node)
             if signature is not None:
-                args = (args[0],) + tuple(
-                    input.meet(arg) for input, arg in zip(signature.inputs, args[1:])
+                self_, *inputs = args
+                args = (
+                    self_,
+                    *[input.meet(arg) for input, arg in zip(signature.inputs, inputs)],
                 )
         else:
             signature = None
@@ -1,19 +1,13 @@
 from kirin.interp import Successor, MethodTable, impl
 from kirin.analysis import const
-from kirin.dialects.cf.stmts import Branch, ConditionalBranch
+from kirin.dialects.cf.stmts import ConditionalBranch
 from kirin.dialects.cf.dialect import dialect
 
 
+# NOTE: `Branch` is handled by the "abstract" table, constprop falls back to it
 @dialect.register(key="constprop")
 class ConstPropMethodTable(MethodTable):
 
-    @impl(Branch)
-    def branch(self, interp: const.Propagate, frame: const.Frame, stmt: Branch):
-        interp.state.current_frame.worklist.append(
-            Successor(stmt.successor, *frame.get_values(stmt.arguments))
-        )
-        return ()
-
     @impl(ConditionalBranch)
     def conditional_branch(
         self,
@@ -21,7 +15,6 @@ class ConstPropMethodTable(MethodTable):
         frame: const.Frame,
         stmt: ConditionalBranch,
     ):
-        frame = interp.state.current_frame
         cond = frame.get(stmt.cond)
         if isinstance(cond, const.Value):
             else_successor = Successor(
@@ -54,7 +54,8 @@ class ConcreteMethods(interp.MethodTable):
         )
         rich.print("[dim]│[/dim] [bold cyan]INFO:[/bold cyan] ", end="", sep="")
         print(frame.get(stmt.msg))
-        for input in stmt.inputs:
+        inputs = stmt.inputs
+        for input, value in zip(inputs, frame.get_values(inputs)):
             rich.print(
                 "[dim]│[/dim] ",
                 input.name or "unknown",
@@ -62,7 +63,7 @@ class ConcreteMethods(interp.MethodTable):
                 end="",
                 sep="",
             )
-            print(frame.get(input))
+            print(value)
         rich.print(
             "[dim]└───────────────────────────────────────────────────────────────[/dim]"
         )
@@ -29,8 +29,10 @@ class Julia(interp.MethodTable):
             emit.callable_to_emit.append(node.callee.code)
             func_name = emit.callables.add(node.callee.code)
 
-        _, call_expr = emit.call(
-            node.callee.code, func_name, *frame.get_values(node.args)
+        # NOTE: emitting a call only formats the call expression, use
+        # the current frame instead of pushing a new one through emit.call
+        call_expr = emit.frame_call(
+            frame, node.callee.code, func_name, *frame.get_values(node.args)
         )
         frame.write_line(f"{frame.ssa[node.result]} = {call_expr}")
         return (frame.ssa[node.result],)
@@ -40,14 +42,15 @@ class Julia(interp.MethodTable):
         self, emit_: emit.Julia[IO_t], frame: emit.JuliaFrame[IO_t], node: Function
     ):
         func_name = emit_.callables[node]
-        frame.set(node.body.blocks[0].args[0], func_name)
-        argnames_: list[str] = []
-        for arg in node.body.blocks[0].args[1:]:
-            frame.set(arg, name := frame.ssa[arg])
-            argnames_.append(name)
-
-        argnames = ", ".join(argnames_)
+        args = node.body.blocks[0].args
+        frame.set(args[0], func_name)
+        # NOTE: the entry block arguments are set with the other
+        # block arguments below, only their names are needed here.
+        argnames = ", ".join([frame.ssa[arg] for arg in args[1:]])
         frame.write_line(f"function {func_name}({argnames})")
+        # NOTE: bind the per-statement calls once, the loop below
+        # runs for every statement in the function body.
+        frame_eval, set_values = emit_.frame_eval, frame.set_values
         with frame.indent():
             for block in node.body.blocks:
                 frame.current_block = block
@@ -57,11 +60,7 @@ class Julia(interp.MethodTable):
 
                 for stmt in block.stmts:
                     frame.current_stmt = stmt
-                    stmt_results = emit_.frame_eval(frame, stmt)
-
-                    match stmt_results:
-                        case tuple():
-                            frame.set_values(stmt._results, stmt_results)
-                        case _:
-                            continue
+                    stmt_results = frame_eval(frame, stmt)
+                    if isinstance(stmt_results, tuple):
+                        set_values(stmt._results, stmt_results)
         frame.write_line("end\n")
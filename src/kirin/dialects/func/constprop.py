@@ -1,4 +1,4 @@
-from kirin import ir, types
+from kirin import ir
 from kirin.interp import MethodTable, ReturnValue, StatementResult, impl
 from kirin.analysis import const
 from kirin.dialects.func.stmts import Call, Invoke, Lambda, Return, GetField
@@ -21,26 +21,38 @@ class DialectConstProp(MethodTable):
     ) -> StatementResult[const.Result]:
         # give up on dynamic method calls
         callee = frame.get(stmt.callee)
-        if isinstance(callee, const.PartialLambda):
+        # NOTE: the lattice element classes are final, compare the class
+        # directly instead of walking the MRO with isinstance
+        if type(callee) is const.PartialLambda:
             call_frame, ret = interp.call(
                 callee.code,
                 callee,
                 *frame.get_values(stmt.inputs),
-                **{k: v for k, v in zip(stmt.keys, frame.get_values(stmt.kwargs))},
+                **(
+                    dict(zip(stmt.keys, frame.get_values(stmt.kwargs)))
+                    if stmt.kwargs
+                    else {}
+                ),
             )
             if not call_frame.frame_is_not_pure:
                 frame.should_be_pure.add(stmt)
             return (ret,)
 
-        if not (isinstance(callee, const.Value) and isinstance(callee.data, ir.Method)):
+        if not (type(callee) is const.Value and isinstance(callee.data, ir.Method)):
             return (const.Result.bottom(),)
 
         mt: ir.Method = callee.data
+        if not stmt.kwargs:
+            ret, is_pure = interp.invoke_method(mt, frame.get_values(stmt.inputs))
+            if is_pure:
+                frame.should_be_pure.add(stmt)
+            return (ret,)
+
         call_frame, ret = interp.call(
             mt.code,
             interp.method_self(mt),
             *frame.get_values(stmt.inputs),
-            **{k: v for k, v in zip(stmt.keys, frame.get_values(stmt.kwargs))},
+            **dict(zip(stmt.keys, frame.get_values(stmt.kwargs))),
         )
         if not call_frame.frame_is_not_pure:
             frame.should_be_pure.add(stmt)
@@ -53,12 +65,8 @@ class DialectConstProp(MethodTable):
         frame: const.Frame,
         stmt: Invoke,
     ) -> StatementResult[const.Result]:
-        invoke_frame, ret = interp.call(
-            stmt.callee.code,
-            interp.method_self(stmt.callee),
-            *frame.get_values(stmt.inputs),
-        )
-        if not invoke_frame.frame_is_not_pure:
+        ret, is_pure = interp.invoke_method(stmt.callee, frame.get_values(stmt.inputs))
+        if is_pure:
             frame.should_be_pure.add(stmt)
         return (ret,)
 
@@ -67,23 +75,15 @@ class DialectConstProp(MethodTable):
         self, interp: const.Propagate, frame: const.Frame, stmt: Lambda
     ) -> StatementResult[const.Result]:
         captured = frame.get_values(stmt.captured)
-        if stmt.body.blocks and types.is_tuple_of(captured, const.Value):
-            return (
-                const.Value(
-                    ir.Method(
-                        dialects=interp.dialects,
-                        code=stmt,
-                        fields=tuple(each.data for each in captured),
-                    )
-                ),
-            )
+        if stmt.body.blocks:
+            # NOTE: for/else instead of all(...) to avoid the generator
+            for each in captured:
+                if not isinstance(each, const.Value):
+                    break
+            else:
+                return (interp.lambda_method(stmt, captured),)  # type: ignore
 
-        return (
-            const.PartialLambda(
-                stmt,
-                tuple(each for each in captured),
-            ),
-        )
+        return (interp.partial_lambda(stmt, captured),)
 
     @impl(GetField)
     def getfield(
@@ -93,11 +93,9 @@ class DialectConstProp(MethodTable):
         stmt: GetField,
     ) -> StatementResult[const.Result]:
         callee_self = frame.get(stmt.obj)
-        if isinstance(callee_self, const.Value) and isinstance(
-            callee_self.data, ir.Method
-        ):
+        if type(callee_self) is const.Value and isinstance(callee_self.data, ir.Method):
             mt: ir.Method = callee_self.data
             return (const.Value(mt.fields[stmt.field]),)
-        elif isinstance(callee_self, const.PartialLambda):
+        elif type(callee_self) is const.PartialLambda:
             return (callee_self.captured[stmt.field],)
         return (const.Unknown(),)
@@ -11,11 +11,15 @@ class Interpreter(MethodTable):
     @impl(Call)
     def call(self, interp: concrete.Interpreter, frame: Frame, stmt: Call):
         mt: Method = frame.get(stmt.callee)
+        if not stmt.kwargs:  # positional arguments only
+            _, ret = interp.call(mt.code, mt, *frame.get_values(stmt.inputs))
+            return (ret,)
+
         _, ret = interp.call(
             mt.code,
             mt,
             *frame.get_values(stmt.inputs),
-            **{k: v for k, v in zip(stmt.keys, frame.get_values(stmt.kwargs))},
+            **dict(zip(stmt.keys, frame.get_values(stmt.kwargs))),
         )
         return (ret,)
 
@@ -45,15 +49,13 @@ class Interpreter(MethodTable):
 
     @impl(Lambda)
     def lambda_(self, interp: concrete.Interpreter, frame: Frame, stmt: Lambda):
+        arg_names = stmt.arg_names
         return (
             Method(
                 dialects=interp.dialects,
                 code=stmt,
-                nargs=len(stmt.body.blocks[0].args),
-                arg_names=[
-                    arg.name or f"%{idx}"
-                    for idx, arg in enumerate(stmt.body.blocks[0].args)
-                ],
+                nargs=len(arg_names),
+                arg_names=arg_names,
                 fields=frame.get_values(stmt.captured),
             ),
         )
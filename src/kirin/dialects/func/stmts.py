@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from types import MethodType as PyClassMethodType, FunctionType as PyFunctionType
 from typing import TypeVar
+from functools import lru_cache
 
 from kirin import ir, types
 from kirin.decl import info, statement
@@ -11,6 +12,13 @@ from .attrs import Signature
 from ._dialect import dialect
 
 
+@lru_cache(maxsize=1024)
+def _kwarg_order(slots: tuple[str, ...], keys: tuple[str, ...]) -> tuple[int, ...]:
+    # NOTE: the slots of a function and the keywords of a call site are
+    # fixed, compute the order of the keyword arguments once per pair.
+    return tuple(keys.index(name) for name in slots if name in keys)
+
+
 class FuncOpCallableInterface(ir.CallableStmtInterface["Function"]):
 
     @classmethod
@@ -23,11 +31,23 @@ class FuncOpCallableInterface(ir.CallableStmtInterface["Function"]):
     def align_input_args(
         cls, stmt: Function, *args: ValueType, **kwargs: ValueType
     ) -> tuple[ValueType, ...]:
-        inputs = [*args]
-        for name in stmt.slots:
-            if name in kwargs:
-                inputs.append(kwargs[name])
-        return tuple(inputs)
+        if not kwargs:  # no keyword arguments, nothing to permute
+            return args
+        return cls.align_keyword_args(stmt, args, tuple(kwargs), tuple(kwargs.values()))
+
+    @classmethod
+    def align_keyword_args(
+        cls,
+        stmt: Function,
+        args: tuple[ValueType, ...],
+        keys: tuple[str, ...],
+        values: tuple[ValueType, ...],
+    ) -> tuple[ValueType, ...]:
+        """Same as `align_input_args`, but with the keyword arguments given
+        as a tuple of names and a tuple of values, e.g. the `keys` and
+        `kwargs` of a `Call` statement.
+        """
+        return (*args, *(values[idx] for idx in _kwarg_order(stmt.slots, keys)))
 
 
 class InvokeCall(ir.StaticCall["Invoke"]):
@@ -120,6 +140,18 @@ class Lambda(ir.Statement):
     def check(self) -> None:
         assert self.body.blocks, "lambda body must not be empty"
 
+    @property
+    def arg_names(self) -> tuple[str, ...]:
+        """The argument names of the lambda body, including `self`.
+
+        Unnamed arguments are named by their position, e.g. `%1`.
+        """
+        # NOTE: not cached, the entry block arguments can be renamed,
+        # inserted or deleted by rewrites after the lambda is built.
+        return tuple(
+            arg.name or f"%{idx}" for idx, arg in enumerate(self.body.blocks[0].args)
+        )
+
     def print_impl(self, printer: Printer) -> None:
         with printer.rich(style="keyword"):
             printer.print_name(self)
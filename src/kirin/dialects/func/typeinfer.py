@@ -13,6 +13,7 @@ from kirin.dialects.func.stmts import (
     Return,
     GetField,
     ConstantNone,
+    FuncOpCallableInterface,
 )
 from kirin.dialects.func._dialect import dialect
 
@@ -47,11 +48,23 @@ class TypeInfer(MethodTable):
         if mt.inferred:  # so we don't end up in infinite loop
             return (mt.return_type,)
 
+        inputs = frame.get_values(stmt.inputs)
+        if not stmt.kwargs:
+            return (interp_.invoke_method(mt, inputs),)
+
+        if trait := mt.code.get_trait(FuncOpCallableInterface):
+            # NOTE: align the keyword arguments without building a dict,
+            # the aligned call is positional and can be memoized
+            inputs = trait.align_keyword_args(
+                mt.code, inputs, stmt.keys, frame.get_values(stmt.kwargs)
+            )
+            return (interp_.invoke_method(mt, inputs),)
+
         _, ret = interp_.call(
             mt.code,
             interp_.method_self(mt),
-            *frame.get_values(stmt.inputs),
-            **{k: v for k, v in zip(stmt.keys, frame.get_values(stmt.kwargs))},
+            *inputs,
+            **dict(zip(stmt.keys, frame.get_values(stmt.kwargs))),
         )
         return (ret,)
 
@@ -68,26 +81,17 @@ class TypeInfer(MethodTable):
         if stmt.callee.inferred:  # so we don't end up in infinite loop
             return (stmt.callee.return_type,)
 
-        _, ret = interp_.call(
-            stmt.callee.code,
-            interp_.method_self(stmt.callee),
-            *frame.get_values(stmt.inputs),
-        )
-        return (ret,)
+        return (interp_.invoke_method(stmt.callee, frame.get_values(stmt.inputs)),)
 
     @impl(Lambda)
     def lambda_(
         self, interp_: TypeInference, frame: Frame[types.TypeAttribute], stmt: Lambda
     ):
-        body_frame, ret = interp_.call(
-            stmt,
-            types.MethodType,
-            *tuple(arg.type for arg in stmt.body.blocks[0].args[1:]),
-        )
-        argtypes = tuple(arg.type for arg in stmt.body.blocks[0].args[1:])
-        ret = types.MethodType[[*argtypes], ret]
+        self_, *args = stmt.body.blocks[0].args
+        argtypes = [arg.type for arg in args]
+        body_frame, ret = interp_.call(stmt, types.MethodType, *argtypes)
+        ret = types.MethodType[argtypes, ret]
         frame.entries.update(body_frame.entries)  # pass results back to upper frame
-        self_ = stmt.body.blocks[0].args[0]
         frame.set(self_, ret)
         return (ret,)
 
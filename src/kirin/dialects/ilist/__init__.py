@@ -24,7 +24,7 @@ from .stmts import (
     IListType as IListType,
 )
 from .passes import IListDesugar as IListDesugar
-from .runtime import IList as IList
+from .runtime import IList as IList, ilist_type as ilist_type
 from ._dialect import dialect as dialect
 from ._wrapper import (  # careful this is not the builtin range
     all as all,
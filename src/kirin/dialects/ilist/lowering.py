@@ -13,7 +13,7 @@ from ._dialect import dialect
 class PythonLowering(lowering.FromPythonAST):
 
     def lower_List(self, state: lowering.State, node: ast.List) -> lowering.Result:
-        elts = tuple(state.lower(each).expect_one() for each in node.elts)
+        elts = state.lower_many(node.elts)
 
         if len(elts):
             typ = elts[0].type
@@ -3,8 +3,7 @@ from kirin.analysis import const
 from kirin.rewrite.abc import RewriteRule, RewriteResult
 from kirin.dialects.py.constant import Constant
 
-from ..stmts import IListType
-from ..runtime import IList
+from ..runtime import IList, ilist_type
 from .._dialect import dialect
 
 
@@ -53,7 +52,7 @@ class ConstList2IList(RewriteRule):
             # specializing the type computation since we know that a
             # range will always be integer typed.
             stmt.result.hints["const"] = const.Value(new_constant)
-            stmt.result.type = IListType[types.Int, types.Literal(len(data))]
+            stmt.result.type = ilist_type(types.Int, len(data))
             node.replace_by(stmt)
             return RewriteResult(has_done_something=True)
 
@@ -66,11 +65,14 @@ class ConstList2IList(RewriteRule):
         if not data.data:
             return False
 
-        elem_type = types.PyClass(type(data[0]))
-        for elem in data.data[1:]:
-            elem_type = elem_type.join(types.PyClass(type(elem)))
+        # NOTE: lists are mostly homogeneous, only join the distinct
+        # element classes (in order of appearance) instead of every element
+        elem_classes = iter(dict.fromkeys(map(type, data.data)))
+        elem_type = types.PyClass(next(elem_classes))
+        for elem_class in elem_classes:
+            elem_type = elem_type.join(types.PyClass(elem_class))
 
-        new_type = IListType[elem_type, types.Literal(len(data.data))]
+        new_type = ilist_type(elem_type, len(data.data))
         new_hint = const.Value(data)
 
         # Check if type and hint are already correct
@@ -1,60 +1,66 @@
 from kirin import ir, types
 from kirin.analysis import const
-from kirin.dialects import py, ilist
 from kirin.rewrite.abc import RewriteRule, RewriteResult
+from kirin.dialects.py.binop import Add
+
+from ..stmts import New, IListType
 
 
 class FlattenAdd(RewriteRule):
 
+    statement_types = (Add,)
+
     def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
+        if not isinstance(node, Add):
+            return RewriteResult()
+
+        lhs = node.lhs
+        rhs = node.rhs
         if not (
-            isinstance(node, py.binop.Add)
-            and (lhs_type := node.lhs.type).is_subseteq(ilist.IListType)
-            and (rhs_type := node.rhs.type).is_subseteq(ilist.IListType)
-            and not lhs_type.is_structurally_equal(types.Bottom)
-            and not rhs_type.is_structurally_equal(types.Bottom)
+            (lhs_type := lhs.type).is_subseteq(IListType)
+            and (rhs_type := rhs.type).is_subseteq(IListType)
+            # NOTE: Bottom is a singleton and a subtype of any IList type
+            and lhs_type is not types.Bottom
+            and rhs_type is not types.Bottom
         ):
             return RewriteResult()
 
         assert isinstance(rhs_type, types.Generic), "Expecting generic type for IList"
         assert isinstance(lhs_type, types.Generic), "Expecting generic type for IList"
 
-        # check if we are adding two ilist.New objects
-        new_data = ()
-
-        # lhs:
-        lhs = node.lhs
-        rhs = node.rhs
-
+        lhs_owner = lhs.owner
+        rhs_owner = rhs.owner
         if (
-            (lhs_parent := lhs.owner.parent) is None
-            or (rhs_parent := rhs.owner.parent) is None
+            (lhs_parent := lhs_owner.parent) is None
+            or (rhs_parent := rhs_owner.parent) is None
             or lhs_parent is not rhs_parent
         ):
             # do not flatten across different blocks/regions
             return RewriteResult()
 
-        if isinstance(lhs.owner, ilist.New):
-            new_data += lhs.owner.values
-        elif (
-            not isinstance(const_lhs := lhs.hints.get("const"), const.Value)
-            or len(const_lhs.data) > 0
-        ):
+        # check if we are adding two ilist.New objects
+        if (lhs_values := self._new_values(lhs)) is None:
             return RewriteResult()
-
-        # rhs:
-        if isinstance(rhs.owner, ilist.New):
-            new_data += rhs.owner.values
-        elif (
-            not isinstance(const_rhs := rhs.hints.get("const"), const.Value)
-            or len(const_rhs.data) > 0
-        ):
+        if (rhs_values := self._new_values(rhs)) is None:
             return RewriteResult()
 
         lhs_elem_type = lhs_type.vars[0]
         rhs_elem_type = rhs_type.vars[0]
 
         result_elem_type = lhs_elem_type.join(rhs_elem_type)
-        node.replace_by(ilist.New(values=new_data, elem_type=result_elem_type))
+        node.replace_by(New(values=lhs_values + rhs_values, elem_type=result_elem_type))
 
         return RewriteResult(has_done_something=True)
+
+    @staticmethod
+    def _new_values(value: ir.SSAValue) -> tuple[ir.SSAValue, ...] | None:
+        """Return the values of the `New` statement producing `value`,
+        `()` for a constant empty list, or `None` if neither.
+        """
+        if isinstance(owner := value.owner, New):
+            return owner.values
+
+        hint = value.hints.get("const")
+        if isinstance(hint, const.Value) and len(hint.data) == 0:
+            return ()
+        return None
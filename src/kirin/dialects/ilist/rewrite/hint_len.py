@@ -13,15 +13,19 @@ class HintLen(RewriteRule):
     def _get_collection_len(self, collection: ir.SSAValue):
         coll_type = collection.type
 
-        if not isinstance(coll_type, types.Generic):
+        # NOTE: `types.Generic` is final, compare the class directly
+        if type(coll_type) is not types.Generic or len(coll_type.vars) != 2:
             return None
 
+        # NOTE: check the cheap literal length first, most collections
+        # do not have a known length
+        length = coll_type.vars[1]
         if (
-            coll_type.is_subseteq(IListType)
-            and isinstance(coll_type.vars[1], types.Literal)
-            and isinstance(coll_type.vars[1].data, int)
+            isinstance(length, types.Literal)
+            and isinstance(length.data, int)
+            and coll_type.is_subseteq(IListType)
         ):
-            return coll_type.vars[1].data
+            return length.data
         else:
             return None
 
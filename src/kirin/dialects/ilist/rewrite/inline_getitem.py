@@ -1,7 +1,7 @@
 from kirin import ir
 from kirin.rewrite import abc
 from kirin.analysis import const
-from kirin.dialects import py
+from kirin.dialects.py.indexing import GetItem
 
 from ..stmts import New
 
@@ -10,16 +10,19 @@ class InlineGetItem(abc.RewriteRule):
     """Rewrite rule to inline GetItem statements for IList.
 
     For example if we have an `ilist.New` statement with a list of items,
-    and we can infer that the index used in `py.GetItem` is constant and within bounds,
-    we replace the `py.GetItem` with the ssa value in the list when the index is an integer
+    and we can infer that the index used in `GetItem` is constant and within bounds,
+    we replace the `GetItem` with the ssa value in the list when the index is an integer
     or with a new `ilist.New` statement containing the sliced items when the index is a slice.
 
     """
 
+    statement_types = (GetItem,)
+
     def rewrite_Statement(self, node: ir.Statement) -> abc.RewriteResult:
-        if not isinstance(node, py.GetItem) or not isinstance(
-            stmt := node.obj.owner, New
-        ):
+        if not isinstance(node, GetItem):
+            return abc.RewriteResult()
+
+        if not isinstance(stmt := node.obj.owner, New):
             return abc.RewriteResult()
 
         if not isinstance(index_const := node.index.hints.get("const"), const.Value):
@@ -28,15 +31,15 @@ class InlineGetItem(abc.RewriteRule):
         if not node.result.uses:
             return abc.RewriteResult()
 
+        # NOTE: `values` is the tuple of SSA values, unlike `args` it
+        # does not build a new view object on every access
+        values = stmt.values
         index = index_const.data
-        if isinstance(index, int) and (
-            0 <= index < len(stmt.args) or -len(stmt.args) <= index < 0
-        ):
-            node.result.replace_by(stmt.args[index])
+        if isinstance(index, int) and -len(values) <= index < len(values):
+            node.result.replace_by(values[index])
             return abc.RewriteResult(has_done_something=True)
         elif isinstance(index, slice):
-            new_tuple = New(tuple(stmt.args[index]))
-            node.replace_by(new_tuple)
+            node.replace_by(New(values[index]))
             return abc.RewriteResult(has_done_something=True)
         else:
             return abc.RewriteResult()
@@ -1,7 +1,10 @@
 from kirin import types
-from kirin.dialects import py, scf, ilist
+from kirin.dialects import py
 from kirin.rewrite.abc import RewriteRule, RewriteResult
 from kirin.ir.nodes.stmt import Statement
+from kirin.dialects.scf.stmts import For
+
+from ..stmts import Range, IListType
 
 
 class ToRangeFor(RewriteRule):
@@ -25,12 +28,15 @@ class ToRangeFor(RewriteRule):
     ```
     """
 
+    statement_types = (For,)
+
     def rewrite_Statement(self, node: Statement) -> RewriteResult:
-        if not (
-            isinstance(node, scf.For)
-            and (iterable := node.iterable).type.is_subseteq(ilist.IListType)
-            and not iterable.type.is_structurally_equal(types.Bottom)
-        ):
+        if not isinstance(node, For):
+            return RewriteResult()
+
+        iterable = node.iterable
+        # NOTE: Bottom is a singleton and a subtype of any IList type
+        if iterable.type is types.Bottom or not iterable.type.is_subseteq(IListType):
             return RewriteResult()
 
         body_block = node.body.blocks[0]
@@ -45,12 +51,12 @@ class ToRangeFor(RewriteRule):
         ele_arg.replace_by(ele_getitem.result)
         body_block.args.delete(ele_arg)
 
-        (len_stmt := py.Len(node.iterable)).insert_before(node)
+        (len_stmt := py.Len(iterable)).insert_before(node)
         (zero := py.Constant(0)).insert_before(node)
         (one := py.Constant(1)).insert_before(node)
-        (
-            range_stmt := ilist.stmts.Range(zero.result, len_stmt.result, one.result)
-        ).insert_before(node)
+        (range_stmt := Range(zero.result, len_stmt.result, one.result)).insert_before(
+            node
+        )
 
         node.iterable = range_stmt.result
 
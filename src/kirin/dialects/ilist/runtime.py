@@ -1,5 +1,6 @@
 # TODO: replace with something faster
 from typing import Any, Generic, TypeVar, overload
+from functools import lru_cache
 from dataclasses import dataclass
 from collections.abc import Sequence
 
@@ -15,6 +16,16 @@ T = TypeVar("T")
 L = TypeVar("L")
 
 
+@lru_cache(maxsize=1024)
+def ilist_type(elem: types.TypeAttribute, length: int) -> types.Generic:
+    """Return the `IList` type with element type `elem` and a literal `length`.
+
+    Type attributes are immutable, so the same type object is shared between
+    all callers asking for the same element type and length.
+    """
+    return types.Generic(IList, elem, types.Literal(length))
+
+
 @dataclass
 @dialect.register
 class IList(ir.Data[Sequence[T]], Sequence[T], Generic[T, L]):
@@ -25,10 +36,9 @@ class IList(ir.Data[Sequence[T]], Sequence[T], Generic[T, L]):
     elem: types.TypeAttribute = types.Any
 
     def __post_init__(self):
-        self.type = types.Generic(IList, self.elem, types.Literal(len(self.data)))
+        self.type = ilist_type(self.elem, len(self.data))
 
-    def __hash__(self) -> int:
-        return id(self)  # do not hash the data
+    __hash__ = object.__hash__  # do not hash the data
 
     def __len__(self) -> int:
         return len(self.data)
@@ -41,11 +51,9 @@ class IList(ir.Data[Sequence[T]], Sequence[T], Generic[T, L]):
 
     def __add__(self, other):
         if isinstance(other, list):
-            return IList(list(self.data) + other, elem=self.elem)
+            return IList([*self.data, *other], elem=self.elem)
         elif isinstance(other, IList):
-            return IList(
-                list(self.data) + list(other.data), elem=self.elem.join(other.elem)
-            )
+            return IList([*self.data, *other.data], elem=self.elem.join(other.elem))
         else:
             raise TypeError(
                 f"unsupported operand type(s) for +: 'IList' and '{type(other)}'"
@@ -58,7 +66,7 @@ class IList(ir.Data[Sequence[T]], Sequence[T], Generic[T, L]):
     def __radd__(self, other: list[T]) -> "IList[T, Any]": ...
 
     def __radd__(self, other):
-        return IList(other + self.data)
+        return IList([*other, *self.data])
 
     def __repr__(self) -> str:
         return f"IList({self.data})"
@@ -86,6 +94,11 @@ class IList(ir.Data[Sequence[T]], Sequence[T], Generic[T, L]):
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, IList):
             return False
+        if self is value:
+            return True
+        # NOTE: cheap length check before comparing the elements
+        if len(self.data) != len(value.data):
+            return False
         return self.data == value.data
 
     def unwrap(self) -> Sequence[T]:
@@ -11,6 +11,10 @@ ElemT = types.TypeVar("ElemT")
 ListLen = types.TypeVar("ListLen")
 IListType = types.Generic(IList, ElemT, ListLen)
 
+# NOTE: most ilist statements share the same traits, share the frozensets
+_PURE_TRAITS = frozenset({ir.Pure(), lowering.FromPythonCall()})
+_MAYBE_PURE_TRAITS = frozenset({ir.MaybePure(), lowering.FromPythonCall()})
+
 
 @statement(dialect=dialect)
 class Range(ir.Statement):
@@ -24,7 +28,7 @@ class Range(ir.Statement):
 
 @statement(dialect=dialect, init=False)
 class New(ir.Statement):
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _PURE_TRAITS
     values: tuple[ir.SSAValue, ...] = info.argument(ElemT)
     elem_type: types.TypeAttribute = info.attribute()
     result: ir.ResultValue = info.result(IListType[ElemT])
@@ -38,9 +42,9 @@ class New(ir.Statement):
             if not values:
                 elem_type = types.Any
             else:
-                elem_type = values[0].type
-                for v in values[1:]:
-                    elem_type = elem_type.join(v.type)
+                # NOTE: join the distinct types at once, Union simplifies
+                # the subsumed types without building intermediate unions
+                elem_type = types.Union(dict.fromkeys(v.type for v in values))
 
         result_type = IListType[elem_type, types.Literal(len(values))]
         super().__init__(
@@ -53,7 +57,7 @@ class New(ir.Statement):
 
 @statement(dialect=dialect)
 class Push(ir.Statement):
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _PURE_TRAITS
     lst: ir.SSAValue = info.argument(IListType[ElemT])
     value: ir.SSAValue = info.argument(IListType[ElemT])
     result: ir.ResultValue = info.result(IListType[ElemT])
@@ -64,7 +68,7 @@ OutElemT = types.TypeVar("OutElemT")
 
 @statement(dialect=dialect)
 class Map(ir.Statement):
-    traits = frozenset({ir.MaybePure(), lowering.FromPythonCall()})
+    traits = _MAYBE_PURE_TRAITS
     purity: bool = info.attribute(default=False)
     fn: ir.SSAValue = info.argument(types.MethodType[[ElemT], OutElemT])
     collection: ir.SSAValue = info.argument(IListType[ElemT, ListLen])
@@ -73,7 +77,7 @@ class Map(ir.Statement):
 
 @statement(dialect=dialect)
 class Foldr(ir.Statement):
-    traits = frozenset({ir.MaybePure(), lowering.FromPythonCall()})
+    traits = _MAYBE_PURE_TRAITS
     purity: bool = info.attribute(default=False)
     fn: ir.SSAValue = info.argument(types.MethodType[[ElemT, OutElemT], OutElemT])
     collection: ir.SSAValue = info.argument(IListType[ElemT])
@@ -83,7 +87,7 @@ class Foldr(ir.Statement):
 
 @statement(dialect=dialect)
 class Foldl(ir.Statement):
-    traits = frozenset({ir.MaybePure(), lowering.FromPythonCall()})
+    traits = _MAYBE_PURE_TRAITS
     purity: bool = info.attribute(default=False)
     fn: ir.SSAValue = info.argument(types.MethodType[[OutElemT, ElemT], OutElemT])
 
@@ -98,7 +102,7 @@ ResultT = types.TypeVar("ResultT")
 
 @statement(dialect=dialect)
 class Scan(ir.Statement):
-    traits = frozenset({ir.MaybePure(), lowering.FromPythonCall()})
+    traits = _MAYBE_PURE_TRAITS
     purity: bool = info.attribute(default=False)
     fn: ir.SSAValue = info.argument(
         types.MethodType[[OutElemT, ElemT], types.Tuple[OutElemT, ResultT]]
@@ -112,7 +116,7 @@ class Scan(ir.Statement):
 
 @statement(dialect=dialect)
 class ForEach(ir.Statement):
-    traits = frozenset({ir.MaybePure(), lowering.FromPythonCall()})
+    traits = _MAYBE_PURE_TRAITS
     purity: bool = info.attribute(default=False)
     fn: ir.SSAValue = info.argument(types.MethodType[[ElemT], types.NoneType])
     collection: ir.SSAValue = info.argument(IListType[ElemT])
@@ -120,14 +124,14 @@ class ForEach(ir.Statement):
 
 @statement(dialect=dialect)
 class Any(ir.Statement):
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _PURE_TRAITS
     collection: ir.SSAValue = info.argument(IListType[types.Bool, ListLen])
     result: ir.ResultValue = info.result(types.Bool)
 
 
 @statement(dialect=dialect)
 class All(ir.Statement):
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _PURE_TRAITS
     collection: ir.SSAValue = info.argument(IListType[types.Bool, ListLen])
     result: ir.ResultValue = info.result(types.Bool)
 
@@ -6,9 +6,27 @@ from kirin.analysis.typeinfer import TypeInference
 from kirin.dialects.py.indexing import GetItem
 
 from .stmts import New, Push, Range, IListType
-from .runtime import IList
+from .runtime import IList, ilist_type
 from ._dialect import dialect
 
+# NOTE: shared result tuples for the constant cases, so the hot impls
+# below do not allocate a fresh singleton tuple (or a fresh generic) per call
+_ANY = (types.Any,)
+_BOTTOM = (types.Bottom,)
+_EMPTY_ILIST = (IListType[types.Any, types.Literal(0)],)
+_ANY_ILIST = (IListType[types.Any, types.Any],)
+
+
+def _is_ilist_type(typ: types.TypeAttribute) -> bool:
+    """Check if `typ` is a subtype of `IListType`.
+
+    The common case is a concrete `IList[ElemT, ListLen]` generic, which is
+    answered with identity checks instead of dispatching `is_subseteq`.
+    """
+    if typ.__class__ is types.Generic and typ.body is IListType.body:
+        return len(typ.vars) == 2
+    return typ.is_subseteq(IListType)
+
 
 @dialect.register(key="typeinfer")
 class TypeInfer(MethodTable):
@@ -19,7 +37,7 @@ class TypeInfer(MethodTable):
     ):
         result = interp_.maybe_const(stmt.result, IList)
         if result:
-            return (IListType[types.Int, types.Literal(len(result))],)
+            return (ilist_type(types.Int, len(result)),)
         return (IListType[types.Int, types.Any],)
 
     @staticmethod
@@ -37,19 +55,19 @@ class TypeInfer(MethodTable):
         if isinstance(list_type, types.Generic):
             return (list_type.vars[0],)
         else:
-            return (types.Any,)
+            return _ANY
 
     @impl(New)
     def new(self, interp: TypeInference, frame: Frame[types.TypeAttribute], stmt: New):
         values = frame.get_values(stmt.values)
         if not values:
-            return (IListType[types.Any, types.Literal(0)],)
+            return _EMPTY_ILIST
 
         elem_type = values[0]
         for v in values:
             elem_type = elem_type.join(v)
 
-        return (IListType[elem_type, types.Literal(len(values))],)
+        return (ilist_type(elem_type, len(values)),)
 
     @impl(Push)
     def push(
@@ -57,24 +75,24 @@ class TypeInfer(MethodTable):
     ):
         lst_type: types.Generic = frame.get(stmt.lst)  # type: ignore
         value_type = frame.get(stmt.value)
-        if not lst_type.is_subseteq(IListType):
-            return (types.Bottom,)
+        if not _is_ilist_type(lst_type):
+            return _BOTTOM
 
         if not lst_type.vars[0].is_subseteq(value_type):
-            return (types.Bottom,)
+            return _BOTTOM
 
         lst_len = self._get_list_len(lst_type)
         if not isinstance(lst_len, int):
             return (IListType[lst_type.vars[0], types.Any],)
 
-        return (IListType[lst_type.vars[0], types.Literal(lst_len + 1)],)
+        return (ilist_type(lst_type.vars[0], lst_len + 1),)
 
     @impl(Add, types.PyClass(IList), types.PyClass(IList))
     def add(self, interp: TypeInference, frame: Frame[types.TypeAttribute], stmt: Add):
         lhs_type = frame.get(stmt.lhs)
         rhs_type = frame.get(stmt.rhs)
-        if not lhs_type.is_subseteq(IListType) or not rhs_type.is_subseteq(IListType):
-            return (types.Bottom,)
+        if not _is_ilist_type(lhs_type) or not _is_ilist_type(rhs_type):
+            return _BOTTOM
 
         if not isinstance(lhs_type, types.Generic):  # just annotated with list
             lhs_type = IListType[types.Any, types.Any]
@@ -90,7 +108,7 @@ class TypeInfer(MethodTable):
         lhs_len = self._get_list_len(lhs_type)
         rhs_len = self._get_list_len(rhs_type)
         if isinstance(lhs_len, int) and isinstance(rhs_len, int):
-            return (IListType[elem_type, types.Literal(lhs_len + rhs_len)],)
+            return (ilist_type(elem_type, lhs_len + rhs_len),)
         return (IListType[elem_type, types.Any],)
 
     @impl(GetItem, types.PyClass(IList), types.PyClass(int))
@@ -98,12 +116,12 @@ class TypeInfer(MethodTable):
         self, interp: TypeInference, frame: Frame[types.TypeAttribute], stmt: GetItem
     ):
         obj_type = frame.get(stmt.obj)
-        if not obj_type.is_subseteq(IListType):
+        if not _is_ilist_type(obj_type):
             raise TypeError(f"Expected list, got {obj_type}")
 
         # just list type
         if not isinstance(obj_type, types.Generic):
-            return (types.Any,)
+            return _ANY
         else:
             return (obj_type.vars[0],)
 
@@ -112,12 +130,12 @@ class TypeInfer(MethodTable):
         self, interp: TypeInference, frame: Frame[types.TypeAttribute], stmt: GetItem
     ):
         obj_type = frame.get(stmt.obj)
-        if not obj_type.is_subseteq(IListType):
+        if not _is_ilist_type(obj_type):
             raise TypeError(f"Expected list, got {obj_type}")
 
         # just list type
         if not isinstance(obj_type, types.Generic):
-            return (IListType[types.Any, types.Any],)
+            return _ANY_ILIST
         elif index_ := interp.maybe_const(stmt.index, slice):
             # TODO: actually calculate the size
             obj_len = obj_type.vars[1]
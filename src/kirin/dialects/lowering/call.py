@@ -26,18 +26,20 @@ class Lowering(lowering.FromPythonAST):
     ) -> lowering.Result:
         source = state.source
         args, kwargs, keys = self.__lower_Call_args_kwargs(state, node)
-        inputs: list[ir.SSAValue] = [*args]
-        kwargs_ = {k: v for k, v in zip(keys, kwargs)}
 
-        if method.arg_names is None and keys:
-            raise lowering.BuildError("method has no argument names, cannot use kwargs")
+        inputs = args
+        if keys:
+            if method.arg_names is None:
+                raise lowering.BuildError(
+                    "method has no argument names, cannot use kwargs"
+                )
 
-        if method.arg_names and keys:
-            for name in method.arg_names:
-                if name in keys:
-                    inputs.append(kwargs_[name])
+            kwargs_ = dict(zip(keys, kwargs))
+            inputs += tuple(
+                kwargs_[name] for name in method.arg_names if name in kwargs_
+            )
 
-        stmt = func.Invoke(tuple(inputs), callee=method)
+        stmt = func.Invoke(inputs, callee=method)
         stmt.result.type = method.return_type or types.Any
         stmt.source = source
         return state.current_frame.push(stmt)
@@ -47,19 +49,19 @@ class Lowering(lowering.FromPythonAST):
         state: lowering.State,
         node: ast.Call,
     ):
-        args: list[ir.SSAValue] = []
         for arg in node.args:
-            if isinstance(arg, ast.Starred):  # TODO: support *args
+            # NOTE: `ast.Starred` has no subclasses, compare the class directly
+            if type(arg) is ast.Starred:  # TODO: support *args
                 raise lowering.BuildError("starred arguments are not supported")
-            else:
-                args.append(state.lower(arg).expect_one())
+        args = state.lower_many(node.args)
+
+        if not node.keywords:
+            return args, (), ()
 
         keys: list[str] = []
-        kwargs: list[ir.SSAValue] = []
         for kw in node.keywords:
             if kw.arg is None:
                 raise lowering.BuildError("keyword argument must have a name")
             keys.append(kw.arg)
-            kwargs.append(state.lower(kw.value).expect_one())
-
-        return tuple(args), tuple(kwargs), tuple(keys)
+        kwargs = tuple(state.lower(kw.value).expect_one() for kw in node.keywords)
+        return args, kwargs, tuple(keys)
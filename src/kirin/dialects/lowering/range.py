@@ -11,6 +11,9 @@ py = ir.Dialect("lowering.range.py")
 """provides the syntax sugar from built-in range() function to py.range()
 """
 
+# NOTE: FromPythonRangeLike is stateless, share one instance across call sites
+_range_like = lowering.FromPythonRangeLike()
+
 
 @py.register
 class PyLowering(lowering.FromPythonAST):
@@ -19,7 +22,7 @@ class PyLowering(lowering.FromPythonAST):
     def lower_Call_range(
         self, state: lowering.State, node: ast.Call
     ) -> lowering.Result:
-        return lowering.FromPythonRangeLike().lower(PyRange, state, node)
+        return _range_like.lower(PyRange, state, node)
 
 
 @ilist.register
@@ -29,4 +32,4 @@ class IListLowering(lowering.FromPythonAST):
     def lower_Call_range(
         self, state: lowering.State, node: ast.Call
     ) -> lowering.Result:
-        return lowering.FromPythonRangeLike().lower(IListRange, state, node)
+        return _range_like.lower(IListRange, state, node)
@@ -71,6 +71,9 @@ with open(os.path.join(os.path.dirname(__file__), "stmts.py"), "w") as f:
     f.write("from kirin.decl import statement, info\n")
     f.write("from kirin.dialects.math.dialect import dialect\n")
     f.write("\n")
+    f.write("# NOTE: all math statements have the same traits, share one frozenset\n")
+    f.write("_MATH_TRAITS = frozenset({ir.Pure(), lowering.FromPythonCall()})\n")
+    f.write("\n")
     for name, obj, sig in builtin_math_functions():
         fields = "\n".join(
             [
@@ -90,7 +93,7 @@ class {name}(ir.Statement):
     \"\"\"{name} statement, wrapping the math.{name} function
     \"\"\"
     name = "{name}"
-    traits = frozenset({{ir.Pure(), lowering.FromPythonCall()}})
+    traits = _MATH_TRAITS
 {fields}
     result: ir.ResultValue = info.result({ret_type})
 """))
@@ -106,13 +109,10 @@ with open(os.path.join(os.path.dirname(__file__), "interp.py"), "w") as f:
 
     implements = []
     for name, obj, sig in builtin_math_functions():
-        fields = ", ".join(
-            [f"values[{idx}]" for idx, _ in enumerate(sig.parameters.keys())]
-        )
+        fields = ", ".join([f"frame.get(stmt.{arg})" for arg in sig.parameters.keys()])
         implements.append(f"""
     @impl(stmts.{name})
     def {name}(self, interp, frame: Frame, stmt: stmts.{name}):
-        values = frame.get_values(stmt.args)
         return (math.{name}({fields}),)""")
 
     # Write the interpreter class
@@ -11,185 +11,148 @@ class MathMethodTable(MethodTable):
 
     @impl(stmts.acos)
     def acos(self, interp, frame: Frame, stmt: stmts.acos):
-        values = frame.get_values(stmt.args)
-        return (math.acos(values[0]),)
+        return (math.acos(frame.get(stmt.x)),)
 
     @impl(stmts.asin)
     def asin(self, interp, frame: Frame, stmt: stmts.asin):
-        values = frame.get_values(stmt.args)
-        return (math.asin(values[0]),)
+        return (math.asin(frame.get(stmt.x)),)
 
     @impl(stmts.asinh)
     def asinh(self, interp, frame: Frame, stmt: stmts.asinh):
-        values = frame.get_values(stmt.args)
-        return (math.asinh(values[0]),)
+        return (math.asinh(frame.get(stmt.x)),)
 
     @impl(stmts.atan)
     def atan(self, interp, frame: Frame, stmt: stmts.atan):
-        values = frame.get_values(stmt.args)
-        return (math.atan(values[0]),)
+        return (math.atan(frame.get(stmt.x)),)
 
     @impl(stmts.atan2)
     def atan2(self, interp, frame: Frame, stmt: stmts.atan2):
-        values = frame.get_values(stmt.args)
-        return (math.atan2(values[0], values[1]),)
+        return (math.atan2(frame.get(stmt.y), frame.get(stmt.x)),)
 
     @impl(stmts.atanh)
     def atanh(self, interp, frame: Frame, stmt: stmts.atanh):
-        values = frame.get_values(stmt.args)
-        return (math.atanh(values[0]),)
+        return (math.atanh(frame.get(stmt.x)),)
 
     @impl(stmts.ceil)
     def ceil(self, interp, frame: Frame, stmt: stmts.ceil):
-        values = frame.get_values(stmt.args)
-        return (math.ceil(values[0]),)
+        return (math.ceil(frame.get(stmt.x)),)
 
     @impl(stmts.copysign)
     def copysign(self, interp, frame: Frame, stmt: stmts.copysign):
-        values = frame.get_values(stmt.args)
-        return (math.copysign(values[0], values[1]),)
+        return (math.copysign(frame.get(stmt.x), frame.get(stmt.y)),)
 
     @impl(stmts.cos)
     def cos(self, interp, frame: Frame, stmt: stmts.cos):
-        values = frame.get_values(stmt.args)
-        return (math.cos(values[0]),)
+        return (math.cos(frame.get(stmt.x)),)
 
     @impl(stmts.cosh)
     def cosh(self, interp, frame: Frame, stmt: stmts.cosh):
-        values = frame.get_values(stmt.args)
-        return (math.cosh(values[0]),)
+        return (math.cosh(frame.get(stmt.x)),)
 
     @impl(stmts.degrees)
     def degrees(self, interp, frame: Frame, stmt: stmts.degrees):
-        values = frame.get_values(stmt.args)
-        return (math.degrees(values[0]),)
+        return (math.degrees(frame.get(stmt.x)),)
 
     @impl(stmts.erf)
     def erf(self, interp, frame: Frame, stmt: stmts.erf):
-        values = frame.get_values(stmt.args)
-        return (math.erf(values[0]),)
+        return (math.erf(frame.get(stmt.x)),)
 
     @impl(stmts.erfc)
     def erfc(self, interp, frame: Frame, stmt: stmts.erfc):
-        values = frame.get_values(stmt.args)
-        return (math.erfc(values[0]),)
+        return (math.erfc(frame.get(stmt.x)),)
 
     @impl(stmts.exp)
     def exp(self, interp, frame: Frame, stmt: stmts.exp):
-        values = frame.get_values(stmt.args)
-        return (math.exp(values[0]),)
+        return (math.exp(frame.get(stmt.x)),)
 
     @impl(stmts.expm1)
     def expm1(self, interp, frame: Frame, stmt: stmts.expm1):
-        values = frame.get_values(stmt.args)
-        return (math.expm1(values[0]),)
+        return (math.expm1(frame.get(stmt.x)),)
 
     @impl(stmts.fabs)
     def fabs(self, interp, frame: Frame, stmt: stmts.fabs):
-        values = frame.get_values(stmt.args)
-        return (math.fabs(values[0]),)
+        return (math.fabs(frame.get(stmt.x)),)
 
     @impl(stmts.floor)
     def floor(self, interp, frame: Frame, stmt: stmts.floor):
-        values = frame.get_values(stmt.args)
-        return (math.floor(values[0]),)
+        return (math.floor(frame.get(stmt.x)),)
 
     @impl(stmts.fmod)
     def fmod(self, interp, frame: Frame, stmt: stmts.fmod):
-        values = frame.get_values(stmt.args)
-        return (math.fmod(values[0], values[1]),)
+        return (math.fmod(frame.get(stmt.x), frame.get(stmt.y)),)
 
     @impl(stmts.gamma)
     def gamma(self, interp, frame: Frame, stmt: stmts.gamma):
-        values = frame.get_values(stmt.args)
-        return (math.gamma(values[0]),)
+        return (math.gamma(frame.get(stmt.x)),)
 
     @impl(stmts.isfinite)
     def isfinite(self, interp, frame: Frame, stmt: stmts.isfinite):
-        values = frame.get_values(stmt.args)
-        return (math.isfinite(values[0]),)
+        return (math.isfinite(frame.get(stmt.x)),)
 
     @impl(stmts.isinf)
     def isinf(self, interp, frame: Frame, stmt: stmts.isinf):
-        values = frame.get_values(stmt.args)
-        return (math.isinf(values[0]),)
+        return (math.isinf(frame.get(stmt.x)),)
 
     @impl(stmts.isnan)
     def isnan(self, interp, frame: Frame, stmt: stmts.isnan):
-        values = frame.get_values(stmt.args)
-        return (math.isnan(values[0]),)
+        return (math.isnan(frame.get(stmt.x)),)
 
     @impl(stmts.lgamma)
     def lgamma(self, interp, frame: Frame, stmt: stmts.lgamma):
-        values = frame.get_values(stmt.args)
-        return (math.lgamma(values[0]),)
+        return (math.lgamma(frame.get(stmt.x)),)
 
     @impl(stmts.log)
     def log(self, interp, frame: Frame, stmt: stmts.log):
-        values = frame.get_values(stmt.args)
-        return (math.log(values[0], values[1]),)
+        return (math.log(frame.get(stmt.x), frame.get(stmt.base)),)
 
     @impl(stmts.log10)
     def log10(self, interp, frame: Frame, stmt: stmts.log10):
-        values = frame.get_values(stmt.args)
-        return (math.log10(values[0]),)
+        return (math.log10(frame.get(stmt.x)),)
 
     @impl(stmts.log1p)
     def log1p(self, interp, frame: Frame, stmt: stmts.log1p):
-        values = frame.get_values(stmt.args)
-        return (math.log1p(values[0]),)
+        return (math.log1p(frame.get(stmt.x)),)
 
     @impl(stmts.log2)
     def log2(self, interp, frame: Frame, stmt: stmts.log2):
-        values = frame.get_values(stmt.args)
-        return (math.log2(values[0]),)
+        return (math.log2(frame.get(stmt.x)),)
 
     @impl(stmts.pow)
     def pow(self, interp, frame: Frame, stmt: stmts.pow):
-        values = frame.get_values(stmt.args)
-        return (math.pow(values[0], values[1]),)
+        return (math.pow(frame.get(stmt.x), frame.get(stmt.y)),)
 
     @impl(stmts.radians)
     def radians(self, interp, frame: Frame, stmt: stmts.radians):
-        values = frame.get_values(stmt.args)
-        return (math.radians(values[0]),)
+        return (math.radians(frame.get(stmt.x)),)
 
     @impl(stmts.remainder)
     def remainder(self, interp, frame: Frame, stmt: stmts.remainder):
-        values = frame.get_values(stmt.args)
-        return (math.remainder(values[0], values[1]),)
+        return (math.remainder(frame.get(stmt.x), frame.get(stmt.y)),)
 
     @impl(stmts.sin)
     def sin(self, interp, frame: Frame, stmt: stmts.sin):
-        values = frame.get_values(stmt.args)
-        return (math.sin(values[0]),)
+        return (math.sin(frame.get(stmt.x)),)
 
     @impl(stmts.sinh)
     def sinh(self, interp, frame: Frame, stmt: stmts.sinh):
-        values = frame.get_values(stmt.args)
-        return (math.sinh(values[0]),)
+        return (math.sinh(frame.get(stmt.x)),)
 
     @impl(stmts.sqrt)
     def sqrt(self, interp, frame: Frame, stmt: stmts.sqrt):
-        values = frame.get_values(stmt.args)
-        return (math.sqrt(values[0]),)
+        return (math.sqrt(frame.get(stmt.x)),)
 
     @impl(stmts.tan)
     def tan(self, interp, frame: Frame, stmt: stmts.tan):
-        values = frame.get_values(stmt.args)
-        return (math.tan(values[0]),)
+        return (math.tan(frame.get(stmt.x)),)
 
     @impl(stmts.tanh)
     def tanh(self, interp, frame: Frame, stmt: stmts.tanh):
-        values = frame.get_values(stmt.args)
-        return (math.tanh(values[0]),)
+        return (math.tanh(frame.get(stmt.x)),)
 
     @impl(stmts.trunc)
     def trunc(self, interp, frame: Frame, stmt: stmts.trunc):
-        values = frame.get_values(stmt.args)
-        return (math.trunc(values[0]),)
+        return (math.trunc(frame.get(stmt.x)),)
 
     @impl(stmts.ulp)
     def ulp(self, interp, frame: Frame, stmt: stmts.ulp):
-        values = frame.get_values(stmt.args)
-        return (math.ulp(values[0]),)
+        return (math.ulp(frame.get(stmt.x)),)
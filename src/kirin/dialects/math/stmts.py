@@ -3,13 +3,16 @@ from kirin import ir, types, lowering
 from kirin.decl import info, statement
 from kirin.dialects.math.dialect import dialect
 
+# NOTE: all math statements have the same traits, share one frozenset
+_MATH_TRAITS = frozenset({ir.Pure(), lowering.FromPythonCall()})
+
 
 @statement(dialect=dialect)
 class acos(ir.Statement):
     """acos statement, wrapping the math.acos function"""
 
     name = "acos"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -19,7 +22,7 @@ class asin(ir.Statement):
     """asin statement, wrapping the math.asin function"""
 
     name = "asin"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -29,7 +32,7 @@ class asinh(ir.Statement):
     """asinh statement, wrapping the math.asinh function"""
 
     name = "asinh"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -39,7 +42,7 @@ class atan(ir.Statement):
     """atan statement, wrapping the math.atan function"""
 
     name = "atan"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -49,7 +52,7 @@ class atan2(ir.Statement):
     """atan2 statement, wrapping the math.atan2 function"""
 
     name = "atan2"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     y: ir.SSAValue = info.argument(types.Float)
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
@@ -60,7 +63,7 @@ class atanh(ir.Statement):
     """atanh statement, wrapping the math.atanh function"""
 
     name = "atanh"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -70,7 +73,7 @@ class ceil(ir.Statement):
     """ceil statement, wrapping the math.ceil function"""
 
     name = "ceil"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Int)
 
@@ -80,7 +83,7 @@ class copysign(ir.Statement):
     """copysign statement, wrapping the math.copysign function"""
 
     name = "copysign"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     y: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
@@ -91,7 +94,7 @@ class cos(ir.Statement):
     """cos statement, wrapping the math.cos function"""
 
     name = "cos"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -101,7 +104,7 @@ class cosh(ir.Statement):
     """cosh statement, wrapping the math.cosh function"""
 
     name = "cosh"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -111,7 +114,7 @@ class degrees(ir.Statement):
     """degrees statement, wrapping the math.degrees function"""
 
     name = "degrees"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -121,7 +124,7 @@ class erf(ir.Statement):
     """erf statement, wrapping the math.erf function"""
 
     name = "erf"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -131,7 +134,7 @@ class erfc(ir.Statement):
     """erfc statement, wrapping the math.erfc function"""
 
     name = "erfc"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -141,7 +144,7 @@ class exp(ir.Statement):
     """exp statement, wrapping the math.exp function"""
 
     name = "exp"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -151,7 +154,7 @@ class expm1(ir.Statement):
     """expm1 statement, wrapping the math.expm1 function"""
 
     name = "expm1"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -161,7 +164,7 @@ class fabs(ir.Statement):
     """fabs statement, wrapping the math.fabs function"""
 
     name = "fabs"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -171,7 +174,7 @@ class floor(ir.Statement):
     """floor statement, wrapping the math.floor function"""
 
     name = "floor"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Int)
 
@@ -181,7 +184,7 @@ class fmod(ir.Statement):
     """fmod statement, wrapping the math.fmod function"""
 
     name = "fmod"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     y: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
@@ -192,7 +195,7 @@ class gamma(ir.Statement):
     """gamma statement, wrapping the math.gamma function"""
 
     name = "gamma"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -202,7 +205,7 @@ class isfinite(ir.Statement):
     """isfinite statement, wrapping the math.isfinite function"""
 
     name = "isfinite"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Bool)
 
@@ -212,7 +215,7 @@ class isinf(ir.Statement):
     """isinf statement, wrapping the math.isinf function"""
 
     name = "isinf"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Bool)
 
@@ -222,7 +225,7 @@ class isnan(ir.Statement):
     """isnan statement, wrapping the math.isnan function"""
 
     name = "isnan"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Bool)
 
@@ -232,7 +235,7 @@ class lgamma(ir.Statement):
     """lgamma statement, wrapping the math.lgamma function"""
 
     name = "lgamma"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -242,7 +245,7 @@ class log(ir.Statement):
     """log statement, wrapping the math.log function"""
 
     name = "log"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     base: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
@@ -253,7 +256,7 @@ class log10(ir.Statement):
     """log10 statement, wrapping the math.log10 function"""
 
     name = "log10"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -263,7 +266,7 @@ class log1p(ir.Statement):
     """log1p statement, wrapping the math.log1p function"""
 
     name = "log1p"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -273,7 +276,7 @@ class log2(ir.Statement):
     """log2 statement, wrapping the math.log2 function"""
 
     name = "log2"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -283,7 +286,7 @@ class pow(ir.Statement):
     """pow statement, wrapping the math.pow function"""
 
     name = "pow"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     y: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
@@ -294,7 +297,7 @@ class radians(ir.Statement):
     """radians statement, wrapping the math.radians function"""
 
     name = "radians"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -304,7 +307,7 @@ class remainder(ir.Statement):
     """remainder statement, wrapping the math.remainder function"""
 
     name = "remainder"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     y: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
@@ -315,7 +318,7 @@ class sin(ir.Statement):
     """sin statement, wrapping the math.sin function"""
 
     name = "sin"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -325,7 +328,7 @@ class sinh(ir.Statement):
     """sinh statement, wrapping the math.sinh function"""
 
     name = "sinh"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -335,7 +338,7 @@ class sqrt(ir.Statement):
     """sqrt statement, wrapping the math.sqrt function"""
 
     name = "sqrt"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -345,7 +348,7 @@ class tan(ir.Statement):
     """tan statement, wrapping the math.tan function"""
 
     name = "tan"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -355,7 +358,7 @@ class tanh(ir.Statement):
     """tanh statement, wrapping the math.tanh function"""
 
     name = "tanh"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
 
@@ -365,7 +368,7 @@ class trunc(ir.Statement):
     """trunc statement, wrapping the math.trunc function"""
 
     name = "trunc"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Int)
 
@@ -375,6 +378,6 @@ class ulp(ir.Statement):
     """ulp statement, wrapping the math.ulp function"""
 
     name = "ulp"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _MATH_TRAITS
     x: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(types.Float)
@@ -16,6 +16,7 @@ import ast
 from kirin import ir, types, interp, lowering
 from kirin.decl import info, statement
 from kirin.print import Printer
+from kirin.dialects.py.constant import Constant
 
 dialect = ir.Dialect("py.assert")
 
@@ -32,7 +33,7 @@ class Assert(ir.Statement):
         printer.plain_print(" ")
         printer.print(self.condition)
 
-        if self.message:
+        if self.message is not None:
             printer.plain_print(", ")
             printer.print(self.message)
 
@@ -41,8 +42,6 @@ class Assert(ir.Statement):
 class Lowering(lowering.FromPythonAST):
 
     def lower_Assert(self, state: lowering.State, node: ast.Assert) -> lowering.Result:
-        from kirin.dialects.py.constant import Constant
-
         cond = state.lower(node.test).expect_one()
         if node.msg:
             message = state.lower(node.msg).expect_one()
@@ -64,10 +63,9 @@ class Concrete(interp.MethodTable):
         if frame.get(stmt.condition) is True:
             return ()
 
-        if stmt.message:
-            raise AssertionError(frame.get(stmt.message))
-        else:
-            raise AssertionError("Assertion failed")
+        # NOTE: message is a required argument, lowering pushes an
+        # empty string constant when the assert has no message.
+        raise AssertionError(frame.get(stmt.message))
 
 
 @dialect.register(key="typeinfer")
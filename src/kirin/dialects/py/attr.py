@@ -10,6 +10,8 @@ This dialect maps `ast.Attribute` nodes to the `GetAttr` statement.
 """
 
 import ast
+from operator import attrgetter
+from functools import lru_cache
 
 from kirin import ir, interp, lowering
 from kirin.decl import info, statement
@@ -17,6 +19,13 @@ from kirin.decl import info, statement
 dialect = ir.Dialect("py.attr")
 
 
+@lru_cache(maxsize=1024)
+def _attrgetter(attrname: str) -> attrgetter:
+    # NOTE: shared between statements accessing the same attribute,
+    # keyed by name so that renaming `attrname` is picked up.
+    return attrgetter(attrname)
+
+
 @statement(dialect=dialect)
 class GetAttr(ir.Statement):
     name = "getattr"
@@ -25,13 +34,18 @@ class GetAttr(ir.Statement):
     attrname: str = info.attribute()
     result: ir.ResultValue = info.result()
 
+    @property
+    def getter(self) -> attrgetter:
+        """attribute getter for the current `attrname`."""
+        return _attrgetter(self.attrname)
+
 
 @dialect.register
 class Concrete(interp.MethodTable):
 
     @interp.impl(GetAttr)
     def getattr(self, interp: interp.Interpreter, frame: interp.Frame, stmt: GetAttr):
-        return (getattr(frame.get(stmt.obj), stmt.attrname),)
+        return (stmt.getter(frame.get(stmt.obj)),)
 
 
 @dialect.register
@@ -41,7 +55,8 @@ class Lowering(lowering.FromPythonAST):
         self, state: lowering.State, node: ast.Attribute
     ) -> lowering.Result:
 
-        if not isinstance(node.ctx, ast.Load):
+        # NOTE: `ast.Load` has no subclasses, compare the class directly
+        if type(node.ctx) is not ast.Load:
             raise lowering.BuildError(f"unsupported attribute context {node.ctx}")
 
         # NOTE: eagerly load global variables
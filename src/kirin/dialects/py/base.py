@@ -18,12 +18,14 @@ class PythonLowering(lowering.FromPythonAST):
 
     def lower_Name(self, state: lowering.State, node: ast.Name) -> lowering.Result:
         name = node.id
-        if isinstance(node.ctx, ast.Load):
+        # NOTE: the expression contexts have no subclasses, compare the class directly
+        ctx = type(node.ctx)
+        if ctx is ast.Load:
             value = state.current_frame.get(name)
             if value is None:
                 raise lowering.BuildError(f"{name} is not defined")
             return value
-        elif isinstance(node.ctx, ast.Store):
+        elif ctx is ast.Store:
             raise lowering.BuildError("unhandled store operation")
         else:  # Del
             raise lowering.BuildError("unhandled del operation")
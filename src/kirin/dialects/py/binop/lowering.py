@@ -5,6 +5,22 @@ from kirin import lowering
 from . import stmts
 from ._dialect import dialect
 
+_BINOPS: dict[type[ast.operator], type[stmts.BinOp]] = {
+    ast.Add: stmts.Add,
+    ast.Sub: stmts.Sub,
+    ast.Mult: stmts.Mult,
+    ast.Div: stmts.Div,
+    ast.Mod: stmts.Mod,
+    ast.Pow: stmts.Pow,
+    ast.LShift: stmts.LShift,
+    ast.RShift: stmts.RShift,
+    ast.BitAnd: stmts.BitAnd,
+    ast.BitOr: stmts.BitOr,
+    ast.BitXor: stmts.BitXor,
+    ast.FloorDiv: stmts.FloorDiv,
+    ast.MatMult: stmts.MatMult,
+}
+
 
 @dialect.register
 class Lowering(lowering.FromPythonAST):
@@ -13,7 +29,7 @@ class Lowering(lowering.FromPythonAST):
         lhs = state.lower(node.left).expect_one()
         rhs = state.lower(node.right).expect_one()
 
-        if op := getattr(stmts, node.op.__class__.__name__, None):
+        if op := _BINOPS.get(type(node.op)):
             stmt = op(lhs=lhs, rhs=rhs)
         else:
             raise lowering.BuildError(f"unsupported binop {node.op}")
@@ -19,11 +19,14 @@ dialect = ir.Dialect("py.builtin")
 
 T = types.TypeVar("T", bound=types.Int | types.Float)
 
+# NOTE: all builtin statements have the same traits, share one frozenset
+_BUILTIN_TRAITS = frozenset({ir.Pure(), lowering.FromPythonCall()})
+
 
 @statement(dialect=dialect)
 class Abs(ir.Statement):
     name = "abs"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _BUILTIN_TRAITS
     value: ir.SSAValue = info.argument(T, print=False)
     result: ir.ResultValue = info.result(T)
 
@@ -31,7 +34,7 @@ class Abs(ir.Statement):
 @statement(dialect=dialect)
 class Sum(ir.Statement):
     name = "sum"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _BUILTIN_TRAITS
     value: ir.SSAValue = info.argument(types.Any, print=False)
     result: ir.ResultValue = info.result(types.Any)
 
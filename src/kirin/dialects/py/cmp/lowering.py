@@ -6,6 +6,19 @@ from kirin.dialects.py import boolop
 from . import stmts
 from ._dialect import dialect
 
+_CMPOPS: dict[type[ast.cmpop], type[stmts.Cmp]] = {
+    ast.Eq: stmts.Eq,
+    ast.NotEq: stmts.NotEq,
+    ast.Lt: stmts.Lt,
+    ast.Gt: stmts.Gt,
+    ast.LtE: stmts.LtE,
+    ast.GtE: stmts.GtE,
+    ast.Is: stmts.Is,
+    ast.IsNot: stmts.IsNot,
+    ast.In: stmts.In,
+    ast.NotIn: stmts.NotIn,
+}
+
 
 @dialect.register
 class PythonLowering(lowering.FromPythonAST):
@@ -25,7 +38,7 @@ class PythonLowering(lowering.FromPythonAST):
 
         cmp_results: list[ir.SSAValue] = []
         for op, rhs in zip(node.ops, comparators):
-            if cls := getattr(stmts, op.__class__.__name__, None):
+            if cls := _CMPOPS.get(type(op)):
                 stmt: stmts.Cmp = cls(lhs=lhs, rhs=rhs)
             else:
                 raise lowering.BuildError(f"unsupported compare operator {op}")
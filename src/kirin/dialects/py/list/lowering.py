@@ -1,6 +1,6 @@
 import ast
 
-from kirin import types, lowering
+from kirin import lowering
 from kirin.dialects.py._comprehension import lower_listcomp_via_desugaring
 
 from .stmts import New
@@ -10,16 +10,8 @@ from ._dialect import dialect
 @dialect.register
 class PythonLowering(lowering.FromPythonAST):
     def lower_List(self, state: lowering.State, node: ast.List) -> lowering.Result:
-        elts = tuple(state.lower(each).expect_one() for each in node.elts)
-
-        if len(elts):
-            typ = elts[0].type
-            for each in elts:
-                typ = typ.join(each.type)
-        else:
-            typ = types.Any
-
-        return state.current_frame.push(New(values=tuple(elts)))
+        elts = state.lower_many(node.elts)
+        return state.current_frame.push(New(values=elts))
 
     def lower_ListComp(
         self, state: lowering.State, node: ast.ListComp
@@ -11,9 +11,7 @@ from ._dialect import dialect
 class PythonLowering(lowering.FromPythonAST):
 
     def lower_Set(self, state: lowering.State, node: ast.Set) -> lowering.Result:
-        return state.current_frame.push(
-            New(tuple(state.lower(each).expect_one() for each in node.elts))
-        )
+        return state.current_frame.push(New(state.lower_many(node.elts)))
 
     def lower_SetComp(
         self, state: lowering.State, node: ast.SetComp
@@ -29,6 +29,9 @@ class SliceLowering(lowering.FromPythonCall["Slice"]):
 
 T = types.TypeVar("T")
 
+# NOTE: Statement copies args_slice, share one dict across Slice statements
+_SLICE_ARGS = {"start": 0, "stop": 1, "step": 2}
+
 
 @statement(dialect=dialect, init=False)
 class Slice(ir.Statement):
@@ -58,7 +61,7 @@ class Slice(ir.Statement):
         super().__init__(
             args=(start, stop, step),
             result_types=[result_type],
-            args_slice={"start": 0, "stop": 1, "step": 2},
+            args_slice=_SLICE_ARGS,
         )
 
 
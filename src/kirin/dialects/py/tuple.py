@@ -98,6 +98,4 @@ class ConstPropTable(interp.MethodTable):
 class Lowering(lowering.FromPythonAST):
 
     def lower_Tuple(self, state: lowering.State, node: ast.Tuple) -> lowering.Result:
-        return state.current_frame.push(
-            New(tuple(state.lower(elem).expect_one() for elem in node.elts))
-        )
+        return state.current_frame.push(New(state.lower_many(node.elts)))
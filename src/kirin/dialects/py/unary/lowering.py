@@ -5,6 +5,13 @@ from kirin import lowering
 from . import stmts
 from ._dialect import dialect
 
+_UNARYOPS: dict[type[ast.unaryop], type[stmts.UnaryOp]] = {
+    ast.UAdd: stmts.UAdd,
+    ast.USub: stmts.USub,
+    ast.Not: stmts.Not,
+    ast.Invert: stmts.Invert,
+}
+
 
 @dialect.register
 class Lowering(lowering.FromPythonAST):
@@ -12,7 +19,7 @@ class Lowering(lowering.FromPythonAST):
     def lower_UnaryOp(
         self, state: lowering.State, node: ast.UnaryOp
     ) -> lowering.Result:
-        if op := getattr(stmts, node.op.__class__.__name__, None):
+        if op := _UNARYOPS.get(type(node.op)):
             return state.current_frame.push(op(state.lower(node.operand).expect_one()))
         else:
             raise lowering.BuildError(f"unsupported unary operator {node.op}")
@@ -65,25 +65,29 @@ class TypeInfer(interp.MethodTable):
 
 
 def unpacking(state: lowering.State, node: ast.expr, value: ir.SSAValue):
-    if isinstance(node, ast.Name):
-        state.current_frame.defs[node.id] = value
-        value.name = node.id
-        return
-    elif not isinstance(node, ast.Tuple):
-        raise lowering.BuildError(f"unsupported unpack node {node}")
-
-    names: list[str | None] = []
-    continue_unpack: list[int] = []
-    for idx, item in enumerate(node.elts):
-        if isinstance(item, ast.Name):
-            names.append(item.id)
-        else:
-            names.append(None)
-            continue_unpack.append(idx)
-    stmt = state.current_frame.push(Unpack(value, tuple(names)))
-    for name, result in zip(names, stmt.results):
-        if name is not None:
-            state.current_frame.defs[name] = result
-
-    for idx in continue_unpack:
-        unpacking(state, node.elts[idx], stmt.results[idx])
+    # NOTE: walk nested targets with an explicit stack, pushing the nested
+    # targets in reverse so statements are emitted in the same depth-first
+    # order as the source.
+    stack: list[tuple[ast.expr, ir.SSAValue]] = [(node, value)]
+    while stack:
+        node, value = stack.pop()
+        if isinstance(node, ast.Name):
+            state.current_frame.defs[node.id] = value
+            value.name = node.id
+            continue
+        elif not isinstance(node, ast.Tuple):
+            raise lowering.BuildError(f"unsupported unpack node {node}")
+
+        names = tuple(
+            item.id if isinstance(item, ast.Name) else None for item in node.elts
+        )
+        stmt = state.current_frame.push(Unpack(value, names))
+        results = stmt.results
+        for name, result in zip(names, results):
+            if name is not None:
+                state.current_frame.defs[name] = result
+
+        # NOTE: the targets without a name are nested and need unpacking
+        for idx in reversed(range(len(names))):
+            if names[idx] is None:
+                stack.append((node.elts[idx], results[idx]))
@@ -24,10 +24,10 @@ class Concrete(interp.MethodTable):
     def for_loop(self, interp_: interp.Interpreter, frame: interp.Frame, stmt: For):
         iterable = frame.get(stmt.iterable)
         loop_vars = frame.get_values(stmt.initializers)
+        # NOTE: bind the per-iteration lookups to locals once
+        body, frame_call_region = stmt.body, interp_.frame_call_region
         for value in iterable:
-            loop_vars = interp_.frame_call_region(
-                frame, stmt, stmt.body, value, *loop_vars
-            )
+            loop_vars = frame_call_region(frame, stmt, body, value, *loop_vars)
             if isinstance(loop_vars, interp.ReturnValue):
                 return loop_vars
             elif loop_vars is None:
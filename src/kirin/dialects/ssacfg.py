@@ -14,15 +14,20 @@ class Concrete(interp.MethodTable):
     def ssacfg(self, interp_: interp.Interpreter, frame: interp.Frame, node: ir.Region):
         block = node.blocks[0]
         block_inputs = frame.get_values(block.args)
+        frame_eval = interp_.frame_eval
         while block is not None:
             frame.current_block = block
             frame.set_values(block.args, block_inputs)
             for stmt in block.stmts:
                 frame.current_stmt = stmt
-                stmt_results = interp_.frame_eval(frame, stmt)
+                stmt_results = frame_eval(frame, stmt)
+                # NOTE: most statements return a tuple, check it before
+                # matching the special results
+                if isinstance(stmt_results, tuple):
+                    frame.set_values(stmt._results, stmt_results)
+                    continue
+
                 match stmt_results:
-                    case tuple():
-                        frame.set_values(stmt._results, stmt_results)
                     case None:
                         continue
                     case interp.Successor(block, block_inputs):
@@ -6,13 +6,16 @@ from ._dialect import dialect
 
 ListLen = types.TypeVar("ListLen")
 
+# NOTE: all vmath statements have the same traits, share one frozenset
+_VMATH_TRAITS = frozenset({ir.Pure(), lowering.FromPythonCall()})
+
 
 @statement(dialect=dialect)
 class add(ir.Statement):
     """Addition statement"""
 
     name = "add"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     lhs: ir.SSAValue = info.argument(
         ilist.IListType[types.Float, ListLen] | types.Float
     )
@@ -27,7 +30,7 @@ class acos(ir.Statement):
     """acos statement, wrapping the math.acos function"""
 
     name = "acos"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -37,7 +40,7 @@ class asin(ir.Statement):
     """asin statement, wrapping the math.asin function"""
 
     name = "asin"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -47,7 +50,7 @@ class asinh(ir.Statement):
     """asinh statement, wrapping the math.asinh function"""
 
     name = "asinh"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -57,7 +60,7 @@ class atan(ir.Statement):
     """atan statement, wrapping the math.atan function"""
 
     name = "atan"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -67,7 +70,7 @@ class atan2(ir.Statement):
     """atan2 statement, wrapping the math.atan2 function"""
 
     name = "atan2"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     y: ir.SSAValue = info.argument(types.Float)
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
@@ -78,7 +81,7 @@ class atanh(ir.Statement):
     """atanh statement, wrapping the math.atanh function"""
 
     name = "atanh"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -88,7 +91,7 @@ class ceil(ir.Statement):
     """ceil statement, wrapping the math.ceil function"""
 
     name = "ceil"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -98,7 +101,7 @@ class copysign(ir.Statement):
     """copysign statement, wrapping the math.copysign function"""
 
     name = "copysign"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     y: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
@@ -109,7 +112,7 @@ class cos(ir.Statement):
     """cos statement, wrapping the math.cos function"""
 
     name = "cos"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -119,7 +122,7 @@ class cosh(ir.Statement):
     """cosh statement, wrapping the math.cosh function"""
 
     name = "cosh"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -129,7 +132,7 @@ class degrees(ir.Statement):
     """degrees statement, wrapping the math.degrees function"""
 
     name = "degrees"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -139,7 +142,7 @@ class div(ir.Statement):
     """multiplication statement, scalar*list or list*list"""
 
     name = "div"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     lhs: ir.SSAValue = info.argument(
         ilist.IListType[types.Float, ListLen] | types.Float
     )
@@ -154,7 +157,7 @@ class erf(ir.Statement):
     """erf statement, wrapping the math.erf function"""
 
     name = "erf"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -164,7 +167,7 @@ class erfc(ir.Statement):
     """erfc statement, wrapping the math.erfc function"""
 
     name = "erfc"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -174,7 +177,7 @@ class exp(ir.Statement):
     """exp statement, wrapping the math.exp function"""
 
     name = "exp"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -184,7 +187,7 @@ class expm1(ir.Statement):
     """expm1 statement, wrapping the math.expm1 function"""
 
     name = "expm1"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -194,7 +197,7 @@ class fabs(ir.Statement):
     """fabs statement, wrapping the math.fabs function"""
 
     name = "fabs"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -204,7 +207,7 @@ class floor(ir.Statement):
     """floor statement, wrapping the math.floor function"""
 
     name = "floor"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -214,7 +217,7 @@ class fmod(ir.Statement):
     """fmod statement, wrapping the math.fmod function"""
 
     name = "fmod"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     y: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
@@ -225,7 +228,7 @@ class gamma(ir.Statement):
     """gamma statement, wrapping the math.gamma function"""
 
     name = "gamma"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -235,7 +238,7 @@ class isfinite(ir.Statement):
     """isfinite statement, wrapping the math.isfinite function"""
 
     name = "isfinite"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Bool, ListLen])
 
@@ -245,7 +248,7 @@ class isinf(ir.Statement):
     """isinf statement, wrapping the math.isinf function"""
 
     name = "isinf"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Bool, ListLen])
 
@@ -255,7 +258,7 @@ class isnan(ir.Statement):
     """isnan statement, wrapping the math.isnan function"""
 
     name = "isnan"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Bool, ListLen])
 
@@ -265,7 +268,7 @@ class lgamma(ir.Statement):
     """lgamma statement, wrapping the math.lgamma function"""
 
     name = "lgamma"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -275,7 +278,7 @@ class log10(ir.Statement):
     """log10 statement, wrapping the math.log10 function"""
 
     name = "log10"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -285,7 +288,7 @@ class log1p(ir.Statement):
     """log1p statement, wrapping the math.log1p function"""
 
     name = "log1p"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -295,7 +298,7 @@ class log2(ir.Statement):
     """log2 statement, wrapping the math.log2 function"""
 
     name = "log2"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -305,7 +308,7 @@ class mult(ir.Statement):
     """multiplication statement, scalar*list or list*list"""
 
     name = "mult"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     lhs: ir.SSAValue = info.argument(
         ilist.IListType[types.Float, ListLen] | types.Float
     )
@@ -320,7 +323,7 @@ class pow(ir.Statement):
     """pow statement, wrapping the math.pow function"""
 
     name = "pow"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     y: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
@@ -331,7 +334,7 @@ class radians(ir.Statement):
     """radians statement, wrapping the math.radians function"""
 
     name = "radians"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -341,7 +344,7 @@ class remainder(ir.Statement):
     """remainder statement, wrapping the math.remainder function"""
 
     name = "remainder"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     y: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
@@ -352,7 +355,7 @@ class sin(ir.Statement):
     """sin statement, wrapping the math.sin function"""
 
     name = "sin"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -362,7 +365,7 @@ class sinh(ir.Statement):
     """sinh statement, wrapping the math.sinh function"""
 
     name = "sinh"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -372,7 +375,7 @@ class sub(ir.Statement):
     """multiplication statement, scalar*list or list*list"""
 
     name = "sub"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     lhs: ir.SSAValue = info.argument(
         ilist.IListType[types.Float, ListLen] | types.Float
     )
@@ -387,7 +390,7 @@ class sqrt(ir.Statement):
     """sqrt statement, wrapping the math.sqrt function"""
 
     name = "sqrt"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -397,7 +400,7 @@ class tan(ir.Statement):
     """tan statement, wrapping the math.tan function"""
 
     name = "tan"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -407,7 +410,7 @@ class tanh(ir.Statement):
     """tanh statement, wrapping the math.tanh function"""
 
     name = "tanh"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -417,7 +420,7 @@ class trunc(ir.Statement):
     """trunc statement, wrapping the math.trunc function"""
 
     name = "trunc"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
 
@@ -427,7 +430,7 @@ class scale(ir.Statement):
     """scale with a scalar statement"""
 
     name = "scale"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     value: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
@@ -438,7 +441,7 @@ class offset(ir.Statement):
     """offset with a scalar statement"""
 
     name = "offset"
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = _VMATH_TRAITS
     x: ir.SSAValue = info.argument(ilist.IListType[types.Float, ListLen])
     value: ir.SSAValue = info.argument(types.Float)
     result: ir.ResultValue = info.result(ilist.IListType[types.Float, ListLen])
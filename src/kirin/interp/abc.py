@@ -51,6 +51,11 @@ class InterpreterABC(ABC, Generic[FrameType, ValueType]):
 
     registry: dict[Signature, BoundedDef] = field(init=False, compare=False)
     """The registry of implementations"""
+    _registry_by_type: dict[type, BoundedDef] = field(
+        init=False, compare=False, repr=False
+    )
+    """Implementations of statements that are not overloaded on argument types,
+    indexed directly by statement class."""
     symbol_table: dict[str, ir.Statement] = field(init=False, compare=False)
     """The symbol table of the interpreter."""
     state: InterpreterState[FrameType] = field(init=False, compare=False)
@@ -76,6 +81,15 @@ class InterpreterABC(ABC, Generic[FrameType, ValueType]):
         self.registry = self.dialects.registry.interpreter(keys=self.keys)
         self.symbol_table = self.dialects.symbol_table
 
+        overloaded = {sig.head for sig in self.registry if sig.args}
+        self._registry_by_type = {
+            sig.head: method
+            for sig, method in self.registry.items()
+            if isinstance(sig.head, type)
+            and not sig.args
+            and sig.head not in overloaded
+        }
+
     def initialize(self) -> Self:
         self.state = InterpreterState()
         return self
@@ -179,13 +193,16 @@ class InterpreterABC(ABC, Generic[FrameType, ValueType]):
         corresponding implementation of its callable region execution convention in
         the interpreter.
         """
+        # NOTE: check the depth first, nothing below is needed
+        # once the recursion limit is reached.
+        if self.state.depth >= self.max_depth:
+            return self.recursion_limit_reached()
+
         if entry := node.get_trait(ir.EntryPointInterface):
             node = self.symbol_table[entry.get_entry_point_symbol(node)]
         trait = node.get_present_trait(ir.CallableStmtInterface)
         args = trait.align_input_args(node, *args, **kwargs)
         region = trait.get_callable_region(node)
-        if self.state.depth >= self.max_depth:
-            return self.recursion_limit_reached()
 
         ret = self.frame_call_region(frame, node, region, *args)
         if isinstance(ret, ReturnValue):
@@ -339,6 +356,11 @@ class InterpreterABC(ABC, Generic[FrameType, ValueType]):
     def lookup_registry(
         self, frame: FrameType, node: ir.Statement
     ) -> BoundedDef | None:
+        # NOTE: most statements only have one implementation regardless of
+        # the argument types, skip building the signature for them.
+        if (method := self._registry_by_type.get(node.__class__)) is not None:
+            return method
+
         sig = self.build_signature(frame, node)
         if sig in self.registry:
             return self.registry[sig]
@@ -122,6 +122,18 @@ class Frame(FrameABC[SSAValue, ValueType]):
         else:
             return value
 
+    def get_values(self, keys: Iterable[SSAValue]) -> tuple[ValueType, ...]:
+        if self.has_parent_access:
+            return tuple(self.get(key) for key in keys)
+
+        # NOTE: without parent access this is the same as `get` on each
+        # key, but looks up the entries directly.
+        entries = self.entries
+        try:
+            return tuple([entries[key] for key in keys])
+        except KeyError as e:
+            raise InterpreterError(f"SSAValue {e.args[0]} not found") from None
+
     AType = TypeVar("AType")
     BType = TypeVar("BType")
     CType = TypeVar("CType")
@@ -191,3 +203,8 @@ class Frame(FrameABC[SSAValue, ValueType]):
 
     def set(self, key: SSAValue, value: ValueType) -> None:
         self.entries[key] = value
+
+    def set_values(self, keys: Iterable[SSAValue], values: Iterable[ValueType]) -> None:
+        # NOTE: same as calling `set` for each pair, but in a single
+        # dict update since this runs for every evaluated statement.
+        self.entries.update(zip(keys, values, strict=True))
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import TYPE_CHECKING, Generic, TypeVar, Callable, TypeAlias, overload
+from typing import (
+    TYPE_CHECKING,
+    Generic,
+    TypeVar,
+    Callable,
+    ClassVar,
+    TypeAlias,
+    overload,
+)
 from dataclasses import dataclass
 
 from kirin import ir, types
@@ -204,4 +212,20 @@ def impl(head, *params):
 class MethodTable(ABC):
     """Base class to define lookup tables for interpreting code for IR nodes in a dialect."""
 
-    pass
+    impl_table: ClassVar[dict[str, Def]]
+    """a table of `@impl` definitions in this method table (including
+    the inherited ones), keyed by attribute name.
+    """
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        # NOTE: walk the MRO instead of inspect.getmembers, the latter
+        # calls getattr on every member and Def.__get__ rejects the class.
+        table: dict[str, Def] = {}
+        for base in reversed(cls.__mro__):
+            for name, value in vars(base).items():
+                if isinstance(value, Def):
+                    table[name] = value
+                elif name in table:  # overridden by a non-impl member
+                    del table[name]
+        cls.impl_table = dict(sorted(table.items()))
@@ -35,6 +35,7 @@ class PyAttr(Data[T]):
 
     name = "PyAttr"
     data: T
+    _hash = None
 
     def __init__(self, data: T, pytype: TypeAttribute | None = None):
         self.data = data
@@ -45,7 +46,13 @@ class PyAttr(Data[T]):
             self.type = pytype
 
     def __hash__(self) -> int:
-        return hash((self.type, self.data))
+        # NOTE: PyAttr does not copy or freeze its data, the hash is cached
+        # on the assumption that hashable data is immutable (mutable data is
+        # normally unhashable and raises here). Computed lazily since data
+        # may be unhashable when the attribute is never used as a key.
+        if self._hash is None:
+            self._hash = hash((self.type, self.data))
+        return self._hash
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, PyAttr):
@@ -168,6 +168,17 @@ class PyClassMeta(TypeAttributeMeta):
         self._cache = {}
 
     def __call__(self, typ, *, display_name: str | None = None, prefix="py"):
+        # NOTE: fast path for the common case, e.g `PyAttr(data)` looking up
+        # `PyClass(type(data))` with the default names of an interned class
+        if display_name is None and prefix == "py" and isinstance(typ, type):
+            obj = self._cache.get(typ)
+            if (
+                obj is not None
+                and obj.prefix == "py"
+                and obj.display_name == typ.__name__
+            ):
+                return obj
+
         display_name = display_name if display_name is not None else typ.__name__
 
         if typ is typing.Any:
@@ -583,6 +594,9 @@ class Generic(TypeAttribute, typing.Generic[PyClassType]):
         return self.body.is_subseteq(other.bound)
 
     def is_subseteq_Generic(self, other: "Generic") -> bool:
+        # NOTE: generics are often shared, e.g. the cached `IList` types
+        if self is other:
+            return True
         if other.vararg is None:
             return (
                 self.body.is_subseteq(other.body)
@@ -674,6 +688,8 @@ class Generic(TypeAttribute, typing.Generic[PyClassType]):
     def is_structurally_equal(
         self, other: Attribute, context: dict | None = None
     ) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Generic):
             return False
         if self.body != other.body:
@@ -48,7 +48,7 @@ class Method(Printable, typing.Generic[Param, RetType]):
     """The original Python function. None if no Python function."""
     sym_name: str | None = None
     """The name of the method. None if no name."""
-    arg_names: list[str] | None = None
+    arg_names: typing.Sequence[str] | None = None
     """The argument names of the callable statement. None if no keyword arguments allowed."""
     # values contained if closure
     fields: tuple = field(default_factory=tuple)  # own
@@ -73,7 +73,7 @@ class Method(Printable, typing.Generic[Param, RetType]):
         mod: ModuleType | None = None,
         py_func: typing.Callable[Param, RetType] | None = None,
         sym_name: str | None = None,
-        arg_names: list[str] | None = None,
+        arg_names: typing.Sequence[str] | None = None,
         fields: tuple = (),
         file: str = "",
         lineno_begin: int = 0,
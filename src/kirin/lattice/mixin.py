@@ -14,7 +14,9 @@ class IsSubsetEqMixin(BoundedLattice[BoundedLatticeType]):
     """
 
     def is_subseteq(self, other: BoundedLatticeType) -> bool:
-        if other is self.top():
+        # NOTE: subseteq is reflexive, interned elements (e.g `types.NoneType`)
+        # are compared by identity before dispatching
+        if other is self or other is self.top():
             return True
         elif other is self.bottom():
             return False
@@ -115,8 +115,9 @@ class Frame(Generic[Stmt]):
         return None
 
     def get_local(self, name: str) -> SSAValue | None:
-        if name in self.defs:
-            return self.defs[name]
+        value = self.defs.get(name)
+        if value is not None:
+            return value
 
         if self.parent is None:
             return None  # no parent frame, return None
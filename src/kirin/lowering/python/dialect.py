@@ -8,7 +8,7 @@ import ast
 import inspect
 from abc import ABC
 from typing import TYPE_CHECKING, Any, Callable, ClassVar, TypeAlias
-from dataclasses import dataclass
+from dataclasses import field, dataclass
 
 from kirin.ir.attrs import types
 from kirin.lowering.abc import Result
@@ -53,6 +53,12 @@ class FromPythonAST(ABC):
     """a table of lowering transforms for ast.Call based
     on the callable object if avaiable as a global value.
     """
+    ast_table: dict[str, Callable[[State[ast.AST], ast.AST], Result]] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    """a table of the bound `lower_<name>` methods keyed by the AST node
+    class name, filled the first time a node class is lowered.
+    """
 
     def __init_subclass__(cls) -> None:
         # init the subclass first
@@ -69,9 +75,13 @@ class FromPythonAST(ABC):
 
     def lower(self, state: State[ast.AST], node: ast.AST) -> Result:
         """Entry point of dialect specific lowering."""
-        return getattr(self, f"lower_{node.__class__.__name__}", self.unreachable)(
-            state, node
-        )
+        name = node.__class__.__name__
+        method = self.ast_table.get(name)
+        if method is None:
+            method = self.ast_table[name] = getattr(
+                self, f"lower_{name}", self.unreachable
+            )
+        return method(state, node)
 
     def unreachable(self, state: State[ast.AST], node: ast.AST) -> Result:
         raise BuildError(f"unreachable reached for {node.__class__.__name__}")
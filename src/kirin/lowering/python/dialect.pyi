@@ -29,6 +29,7 @@ class akin:
 
 class FromPythonAST(ABC):
     callee_table: ClassVar[dict[object, Transform]]
+    ast_table: dict[str, Callable[[State[ast.AST], ast.AST], Result]]
 
     @property
     def names(self) -> list[str]: ...
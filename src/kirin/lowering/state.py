@@ -108,6 +108,26 @@ class State(Generic[ASTNodeType]):
         assert isinstance(result, tuple)
         return self.Result(cast(tuple[SSAValue, ...], result))
 
+    def lower_many(self, nodes: Sequence[ASTNodeType]) -> tuple[SSAValue, ...]:
+        """Lower a sequence of nodes that each produce exactly one value.
+
+        This is equivalent to `tuple(state.lower(node).expect_one() for node in nodes)`
+        without wrapping each value in a `Result`.
+        """
+        values: list[SSAValue] = []
+        for node in nodes:
+            result = self.parent.visit(self, node)
+            if isinstance(result, SSAValue):
+                values.append(result)
+                continue
+            elif isinstance(result, Statement):
+                result = result._results
+
+            if result is None or len(result) != 1:
+                raise BuildError("expected a value, but got None")
+            values.append(result[0])
+        return tuple(values)
+
     def get_literal(self, value) -> SSAValue:
         return self.parent.lower_literal(self, value)
 
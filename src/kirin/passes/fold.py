@@ -38,22 +38,26 @@ class Fold(Pass):
 
     def unsafe_run(self, mt: Method) -> RewriteResult:
         result = self.hint_const.unsafe_run(mt)
-        result = (
-            Fixpoint(
-                Walk(
-                    Chain(
-                        ConstantFold(),
-                        InlineGetItem(),
-                        Call2Invoke(),
-                        DeadCodeElimination(),
-                    )
+        fold_result = Fixpoint(
+            Walk(
+                Chain(
+                    ConstantFold(),
+                    InlineGetItem(),
+                    Call2Invoke(),
+                    DeadCodeElimination(),
                 )
             )
-            .rewrite(mt.code)
-            .join(result)
-        )
+        ).rewrite(mt.code)
+        result = fold_result.join(result)
+        # NOTE: dead code elimination is part of the chain above, once the
+        # chain converges it only needs to run again if the CFG changed.
+        converged = not (fold_result.terminated or fold_result.exceeded_max_iter)
 
         if mt.code.has_trait(HasCFG):
-            result = Walk(CFGCompactify()).rewrite(mt.code).join(result)
+            compactify_result = Walk(CFGCompactify()).rewrite(mt.code)
+            converged = converged and not compactify_result.has_done_something
+            result = compactify_result.join(result)
 
+        if converged:
+            return result
         return Fixpoint(Walk(DeadCodeElimination())).rewrite(mt.code).join(result)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import inspect
 from typing import TYPE_CHECKING, Iterable
 from dataclasses import dataclass
 
@@ -93,9 +92,9 @@ class Registry:
                     continue
 
                 dialect_table = dialect.interps[key]
-                for _, member in inspect.getmembers(dialect_table):
-                    if isinstance(member, BoundedDef):
-                        for sig in member.signature:
-                            if sig not in registry:
-                                registry[sig] = member
+                for impl in dialect_table.impl_table.values():
+                    member = BoundedDef(dialect_table, impl.signature, impl.method)
+                    for sig in member.signature:
+                        if sig not in registry:
+                            registry[sig] = member
         return registry
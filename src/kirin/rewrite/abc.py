@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import cast
+from typing import ClassVar, cast
 from dataclasses import field, dataclass
 
 from kirin.ir import Pure, Block, IRNode, Region, MaybePure, Statement
@@ -29,6 +29,15 @@ class RewriteRule(ABC):
     should terminate, and whether the rewrite rule has exceeded the maximum number of iterations.
     """
 
+    statement_types: ClassVar[tuple[type[Statement], ...] | None] = None
+    """The statement types this rule rewrites, `None` for any IR node.
+
+    Rules that only rewrite a few statement types can set this so that
+    [`Chain`][kirin.rewrite.chain.Chain] skips them for any other node.
+    Subclasses of these types are dispatched to the rule as well, so the
+    rule should match its nodes with `isinstance`.
+    """
+
     def rewrite(self, node: IRNode) -> RewriteResult:
         if node.IS_REGION:
             return self.rewrite_Region(cast(Region, node))
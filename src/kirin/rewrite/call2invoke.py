@@ -10,6 +10,8 @@ from kirin.dialects.func import Call, Invoke
 class Call2Invoke(RewriteRule):
     """Rewrite a `Call` statement to an `Invoke` statement."""
 
+    statement_types = (Call,)
+
     def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
         if not isinstance(node, Call):
             return RewriteResult()
@@ -25,9 +27,12 @@ class Call2Invoke(RewriteRule):
 
         method = mt.data
         trait = method.code.get_present_trait(ir.CallableStmtInterface)
-        inputs = trait.align_input_args(
-            method.code, *node.inputs, **dict(zip(node.keys, node.kwargs))
-        )
+        if node.kwargs:
+            inputs = trait.align_input_args(
+                method.code, *node.inputs, **dict(zip(node.keys, node.kwargs))
+            )
+        else:
+            inputs = trait.align_input_args(method.code, *node.inputs)
         stmt = Invoke(inputs=inputs, callee=mt.data)
         for result, new_result in zip(node.results, stmt.results):
             new_result.name = result.name
@@ -1,5 +1,5 @@
 from typing import Iterable
-from dataclasses import dataclass
+from dataclasses import field, dataclass
 
 from kirin.ir import IRNode
 from kirin.rewrite.abc import RewriteRule, RewriteResult
@@ -13,6 +13,10 @@ class Chain(RewriteRule):
     """
 
     rules: list[RewriteRule]
+    _rules_by_type: dict[type, list[RewriteRule]] = field(
+        init=False, repr=False, compare=False
+    )
+    """The rules applying to each node class, see `RewriteRule.statement_types`."""
 
     def __init__(self, rule: RewriteRule | Iterable[RewriteRule], *others: RewriteRule):
         if isinstance(rule, RewriteRule):
@@ -22,10 +26,24 @@ class Chain(RewriteRule):
                 others == ()
             ), "Cannot pass multiple positional arguments if the first argument is an iterable"
             self.rules = list(rule)
+        self._rules_by_type = {}
+
+    def rules_for(self, node: IRNode) -> list[RewriteRule]:
+        """The rules of the chain that apply to `node`, in order."""
+        node_type = node.__class__
+        rules = self._rules_by_type.get(node_type)
+        if rules is None:
+            rules = self._rules_by_type[node_type] = [
+                rule
+                for rule in self.rules
+                if rule.statement_types is None
+                or issubclass(node_type, rule.statement_types)
+            ]
+        return rules
 
     def rewrite(self, node: IRNode) -> RewriteResult:
         has_done_something = False
-        for rule in self.rules:
+        for rule in self.rules_for(node):
             result = rule.rewrite(node)
             if result.terminated:
                 return result
@@ -1,5 +1,7 @@
+from kirin import ir
 from kirin.prelude import basic_no_opt
 from kirin.analysis import const
+from kirin.dialects import func
 
 
 def test_worklist_bfs():
@@ -31,3 +33,136 @@ def test_worklist_bfs():
     prop = const.Propagate(basic_no_opt)
     frame, ret = prop.run(test)
     assert isinstance(ret, const.PartialLambda)
+
+
+def test_partial_lambda_interned():
+    @basic_no_opt
+    def make_ker(val: float):
+
+        def ker(i: float):
+            return i + val
+
+        return ker
+
+    prop = const.Propagate(basic_no_opt)
+    with prop.eval_context():
+        _, first = prop.call(make_ker.code, const.Value(make_ker), const.Unknown())
+        _, second = prop.call(make_ker.code, const.Value(make_ker), const.Unknown())
+
+    assert isinstance(first, const.PartialLambda)
+    assert first is second
+    assert hash(first) == hash(second)
+
+
+def test_partial_lambda_equal_captures():
+    @basic_no_opt
+    def make_ker(val: float):
+
+        def ker(i: float):
+            return i + val
+
+        return ker
+
+    (stmt,) = [
+        stmt
+        for stmt in make_ker.callable_region.walk()
+        if isinstance(stmt, func.Lambda)
+    ]
+    prop = const.Propagate(basic_no_opt)
+    first = prop.partial_lambda(stmt, (const.Value(1.0), const.Unknown()))
+    second = prop.partial_lambda(stmt, (const.Value(1.0), const.Unknown()))
+    assert first is second
+    assert prop.partial_lambda(stmt, (const.Value(1), const.Unknown())) is not first
+    assert prop.partial_lambda(stmt, (const.Value([1.0]),)) is not None
+    assert len(prop._partial_lambdas) == 3
+
+
+def test_invoke_memoized():
+    @basic_no_opt
+    def inner(x: int):
+        return x + 1
+
+    @basic_no_opt
+    def outer(x: int):
+        return inner(x) + inner(x)
+
+    prop = const.Propagate(basic_no_opt)
+    frame, ret = prop.run(outer)
+    assert isinstance(ret, const.Unknown)
+    assert list(prop._invoke_memo) == [(inner, (const.Unknown(),))]
+    assert all(
+        stmt in frame.should_be_pure
+        for stmt in outer.callable_region.walk()
+        if stmt.name == "invoke"
+    )
+
+
+def test_invoke_recursive_not_memoized():
+    @basic_no_opt
+    def swap(x: int, y: int):
+        if x == 0:
+            return 1
+        return swap(y, x)
+
+    @basic_no_opt
+    def main(n: int):
+        c = 5
+        swap(n, c)
+        return swap(c, n)
+
+    prop = const.Propagate(basic_no_opt)
+    _, ret = prop.run(main)
+    assert ret == const.Value(1)
+    assert not prop._invoke_memo
+
+
+def test_invoke_memoized_equal_arguments():
+    @basic_no_opt
+    def inner(x: int):
+        return x + 1
+
+    prop = const.Propagate(basic_no_opt)
+    with prop.eval_context():
+        first = prop.invoke_method(inner, (const.Value(1),))
+        second = prop.invoke_method(inner, (const.Value(1),))
+
+    assert first == (const.Value(2), True)
+    assert second is first
+    assert len(prop._invoke_memo) == 1
+
+
+def test_lambda_method_interned():
+    @basic_no_opt
+    def make_ker(val: float):
+
+        def ker(i: float):
+            return i + val
+
+        return ker
+
+    (stmt,) = [
+        stmt
+        for stmt in make_ker.callable_region.walk()
+        if isinstance(stmt, func.Lambda)
+    ]
+    prop = const.Propagate(basic_no_opt)
+    first = prop.lambda_method(stmt, (const.Value(1.0),))
+    assert first is prop.lambda_method(stmt, (const.Value(1.0),))
+    assert first is not prop.lambda_method(stmt, (const.Value(1),))
+    assert isinstance(first.data, ir.Method)
+    assert first.data.fields == (1.0,)
+
+
+def test_invoke_dynamic_call_argument():
+    @basic_no_opt
+    def inner(x: int):
+        return 1
+
+    @basic_no_opt
+    def main(f):
+        y = f(1)
+        return inner(y)
+
+    prop = const.Propagate(basic_no_opt)
+    _, ret = prop.run(main)
+    assert ret == const.Value(1)
@@ -58,3 +58,36 @@ def test_method_constant_type_infer():
         return ilist.map(_new, ilist.range(n_iter))
 
     assert alloc.return_type.is_subseteq(ilist.IListType[types.Literal(1), types.Any])
+
+
+def test_invoke_memoized():
+    from kirin.prelude import basic_no_opt
+    from kirin.analysis import TypeInference
+
+    @basic_no_opt
+    def inner(x: int):
+        return x + 1
+
+    @basic_no_opt
+    def outer(x: int):
+        return inner(x) + inner(x)
+
+    infer = TypeInference(basic_no_opt)
+    _, ret = infer.run(outer)
+    assert ret.is_subseteq(types.Int)
+    assert list(infer._invoke_memo) == [(inner, (types.Int,))]
+
+
+def test_invoke_recursive_not_memoized():
+    from kirin.prelude import basic
+    from kirin.analysis import TypeInference
+
+    @basic(typeinfer=False)
+    def fib(n: int):
+        if n < 2:
+            return n
+        return fib(n - 1) + fib(n - 2)
+
+    infer = TypeInference(basic).initialize()
+    assert infer.invoke_method(fib, (types.Int,)).is_subseteq(types.Int)
+    assert infer._invoke_memo == {}
@@ -51,3 +51,19 @@ def test_rewrite_closure_no_fields():
     rewrite.Walk(closurefield.ClosureField()).rewrite(bar.code)
     after = bar.code.regions[0].blocks[0].stmts.at(0)
     assert before is after
+
+
+def test_lambda_arg_names_rename():
+    @basic
+    def outer(y: int):
+        def inner(x: int):
+            return x * y + 1
+
+        return inner
+
+    (stmt,) = [
+        stmt for stmt in outer.callable_region.walk() if isinstance(stmt, func.Lambda)
+    ]
+    assert stmt.arg_names == ("inner_self", "x")
+    stmt.body.blocks[0].args[1].name = "z"
+    assert stmt.arg_names == ("inner_self", "z")
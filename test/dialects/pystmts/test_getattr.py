@@ -20,3 +20,13 @@ def test_getattr():
     out = main()
 
     assert out == 2.0
+
+
+def test_getattr_rename():
+    from kirin import ir
+    from kirin.dialects.py.attr import GetAttr
+
+    stmt = GetAttr(ir.TestValue(), attrname="real")
+    assert stmt.getter(1 + 2j) == 1.0
+    stmt.attrname = "imag"
+    assert stmt.getter(1 + 2j) == 2.0
@@ -47,3 +47,26 @@ def test_interp():
 
     interp_ = DummyInterpreter(basic)
     interp_.run_no_raise(main, EmptyLattice())
+
+
+def test_lookup_by_type():
+    from kirin.dialects import func, ilist
+
+    interp_ = interp.Interpreter(basic)
+    # only implemented once, dispatched by statement class
+    assert (
+        interp_._registry_by_type[func.Return]
+        is interp_.registry[interp.Signature(func.Return)]
+    )
+    # overloaded on argument types, must go through the signature
+    assert py.Add not in interp_._registry_by_type
+    assert ilist.New in interp_._registry_by_type
+
+
+def test_impl_table_inherited():
+
+    class SubTable(DialectMethodTable):
+        new_tuple = None  # type: ignore
+
+    assert list(DialectMethodTable.impl_table) == ["new_tuple"]
+    assert SubTable.impl_table == {}
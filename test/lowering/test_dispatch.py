@@ -0,0 +1,46 @@
+import ast
+
+import pytest
+
+from kirin import lowering
+from kirin.lowering import BuildError
+
+
+class Lowering(lowering.FromPythonAST):
+
+    def lower_Name(self, state, node: ast.Name):
+        return "method"
+
+    @staticmethod
+    def lower_Constant(state, node: ast.Constant):
+        return "staticmethod"
+
+    @classmethod
+    def lower_List(cls, state, node: ast.List):
+        return "classmethod"
+
+
+class SubLowering(Lowering):
+
+    def lower_Name(self, state, node: ast.Name):
+        return "override"
+
+
+def test_lower_dispatch():
+    lower = Lowering()
+    assert lower.lower(None, ast.Name("x")) == "method"  # type: ignore
+    assert lower.lower(None, ast.Constant(1)) == "staticmethod"  # type: ignore
+    assert lower.lower(None, ast.List([])) == "classmethod"  # type: ignore
+    assert set(lower.ast_table) == {"Name", "Constant", "List"}
+    with pytest.raises(BuildError):
+        lower.lower(None, ast.Tuple([]))  # type: ignore
+
+
+def test_lower_dispatch_override():
+    assert SubLowering().lower(None, ast.Name("x")) == "override"  # type: ignore
+    assert Lowering().lower(None, ast.Name("x")) == "method"  # type: ignore
+
+    lower = Lowering()
+    lower.lower_Name = lambda state, node: "instance"  # type: ignore
+    assert lower.lower(None, ast.Name("x")) == "instance"  # type: ignore
+    assert "Name" in lower.names
@@ -0,0 +1,29 @@
+from kirin import ir
+from kirin.rewrite import Chain, Call2Invoke, DeadCodeElimination
+from kirin.dialects import py, func
+
+
+def test_chain_rules_for():
+    dce = DeadCodeElimination()
+    call2invoke = Call2Invoke()
+    chain = Chain(call2invoke, dce)
+
+    stmt = py.Constant(1)
+    assert chain.rules_for(stmt) == [dce]
+    assert chain.rules_for(ir.Block()) == [dce]
+
+    call = func.Call(stmt.result, (), kwargs=())
+    assert chain.rules_for(call) == [call2invoke, dce]
+
+
+def test_chain_rules_for_subclass():
+    class MyCall(func.Call):
+        pass
+
+    dce = DeadCodeElimination()
+    call2invoke = Call2Invoke()
+    chain = Chain(call2invoke, dce)
+
+    stmt = py.Constant(1)
+    call = MyCall(stmt.result, (), kwargs=())
+    assert chain.rules_for(call) == [call2invoke, dce]